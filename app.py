@@ -1,5 +1,4 @@
-from flask import Flask, Response, render_template, redirect, url_for, flash, request
-from flask_sqlalchemy import SQLAlchemy 
+from flask import Flask, Response, render_template, redirect, url_for, flash, request, stream_with_context
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFProtect
 from flask_login import LoginManager, login_user, login_required, logout_user, UserMixin
@@ -8,27 +7,37 @@ from wtforms import StringField, PasswordField, SubmitField
 from wtforms.validators import DataRequired, ValidationError
 import secrets
 import json
+import hashlib
+import io
+import click
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
 from functools import wraps
 
 # Config Matrix module imports
 from config_mtrx_module.utils import validate_password, StatusCodes
-from config_mtrx_module.technicians import create_technician, verify_user, retrieve_all_technicians
-from config_mtrx_module.db import  Technicians, get_db_session
+from config_mtrx_module.technicians import create_technician, authenticate_technician, retrieve_technicians, load_technician, technician_cache
+from config_mtrx_module.db import get_db_session, remove_db_session, init_db
+from config_mtrx_module.config import AUTO_INIT_DB, IMPORT_CHUNK_SIZE
 from config_mtrx_module.computers import (
-    create_computer, toggle_step, edit_computer_name, edit_computer_deadline,
+    create_computer, create_computers, expand_computer_names, set_steps_completion, toggle_step, edit_computer_name, edit_computer_deadline,
     get_computer_progress, get_computer_progress_by_id, assign_technicians_to_computer, assign_profile_to_computer,
-    edit_computer_notes, delete_computer, retrieve_all_computers, computer_info, computer_info_by_id,
+    edit_computer_notes, delete_computer, retrieve_all_computers, retrieve_computers_page, search_computers, computer_info, computer_info_by_id,
     set_computer_attribute, get_computer_attribute, get_computer_attributes,
     delete_computer_attribute, set_computer_attributes, toggle_step_by_id, edit_computer_name_by_id,
     edit_computer_deadline_by_id, edit_computer_notes_by_id, assign_technicians_to_computer_by_id,
-    assign_profile_to_computer_by_id, delete_computer_by_id, set_computer_attribute_by_id,
+    assign_profile_to_computer_by_id, assign_profile_to_computers, delete_computer_by_id, set_computer_attribute_by_id,
     get_computer_attribute_by_id, get_computer_attributes_by_id, delete_computer_attribute_by_id,
-    set_computer_attributes_by_id
+    set_computer_attributes_by_id, update_computer_attributes_by_id
 )
 # from config_mtrx_module.db import Session
-from config_mtrx_module.profiles import retrieve_all_profiles, get_profile_steps, create_profile, delete_profile
+from config_mtrx_module.profiles import retrieve_profiles, retrieve_profile_computers, get_profile_steps, create_profile, delete_profile
+from config_mtrx_module.progress import get_progress_stats
+from config_mtrx_module.importer import import_computers, detect_import_format
+from config_mtrx_module.exporter import export_computers, EXPORT_FORMATS
+from config_mtrx_module.attributes import PROPAGATION_POLICIES
+from config_mtrx_module.reference import reference_cache
+from config_mtrx_module.versions import get_data_versions, ALL_COMPUTERS_TABLES, COMPUTER_LIST_TABLES, PROFILE_LIST_TABLES, TECHNICIAN_LIST_TABLES
 
 ### App set up
 
@@ -36,8 +45,6 @@ from config_mtrx_module.profiles import retrieve_all_profiles, get_profile_steps
 app = Flask(__name__)
 # Set the secret key for securely signing the session cookies and CSRF tokens
 app.secret_key = secrets.token_hex(16) # Generate a secure random 32-character hex key
-# Set db location for Flask-SQLAlchemy
-app.config['SQLALCHEMY_DATABASE_URI'] = "sqlite:///computers.db"
 # Making session cookies be able to only be sent over secure HTTPS connections
 app.config['SESSION_COOKIE_SECURE'] = False # PROD: Set to true
 # Prevent client-side JavaScript from accessing the session cookie
@@ -47,11 +54,43 @@ app.config['SESSION_COOKIE_SAMESITE'] = 'Lax' # Ensures the session cookie is no
 # Session configuration for better concurrent handling
 app.config['PERMANENT_SESSION_LIFETIME'] = 3600  # 1 hour session timeout
 app.config['SESSION_REFRESH_EACH_REQUEST'] = True  # Refresh session on each request
-db = SQLAlchemy(app)
 login_manager = LoginManager(app)
 csrf = CSRFProtect(app)
 login_manager.login_view = 'login'  # type: ignore
 login_manager.session_protection = 'strong'  # Strong session protection
+# Release the request's database session (and its pooled connection) once the request is done
+app.teardown_appcontext(remove_db_session)
+
+# Make sure the schema exists once per process, workers started with CONFIG_MATRIX_AUTO_INIT_DB=0 skip it
+if AUTO_INIT_DB:
+    init_db()
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create missing tables and indexes in the configured database."""
+    init_db()
+    print("Database schema is up to date.")
+
+@app.cli.command('import-computers')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'jsonl']), help="Defaults to the file extension.")
+@click.option('--chunk-size', default=IMPORT_CHUNK_SIZE, show_default=True, help="Rows written per transaction.")
+@click.option('--dry-run', is_flag=True, help="Validate the file without writing anything.")
+def import_computers_command(path, file_format, chunk_size, dry_run):
+    """Import computers from a CSV or JSONL file."""
+    def report(summary):
+        print(f"{summary['processed']} rows processed, {summary['created']} created, {summary['failed']} failed")
+
+    with open(path, newline='', encoding='utf-8-sig') as import_file:
+        success, message, summary, _ = import_computers(
+            import_file, file_format or detect_import_format(path), chunk_size, dry_run, progress=report
+        )
+
+    for error in (summary or {}).get('errors', []):
+        print(f"line {error['line']}: {error['name']}: {error['error']}")
+    print(message)
+    if not success:
+        raise SystemExit(1)
 
 class RegisterForm(FlaskForm):
     username = StringField('Username', validators=[DataRequired()])
@@ -89,6 +128,25 @@ def json_response(data, status_code=200):
 def error_response(error_message, status_code=500):
     return json_response({"Error": error_message}, status_code)
 
+def page_args() -> tuple:
+    """Read the keyset pagination parameters (cursor, limit) of a list request, returning (cursor, limit, error)"""
+    try:
+        limit = int(request.args['limit']) if request.args.get('limit') else None
+    except ValueError:
+        return (None, None, "limit must be an integer")
+    return (request.args.get('cursor') or None, limit, None)
+
+def propagation_args(data: dict) -> tuple:
+    """Read the propagate flag and override_policy of a preset attribute write, returning (propagate, override_policy, error)"""
+    propagate = data.get('propagate', False)
+    # Only a JSON boolean is accepted, bool("false") would silently turn propagation on
+    if not isinstance(propagate, bool):
+        return (None, None, "propagate must be true or false")
+    override_policy = data.get('override_policy', 'keep')
+    if override_policy not in PROPAGATION_POLICIES:
+        return (None, None, f"override_policy must be one of: {', '.join(PROPAGATION_POLICIES)}")
+    return (propagate, override_policy, None)
+
 def handle_api_errors(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -99,19 +157,46 @@ def handle_api_errors(f):
             return error_response(str(e), 500)
     return decorated_function
 
+def etag_cached(tables: tuple):
+    """Answer GET requests with a strong ETag built from the change counters of the tables the view reads.
+
+    The tag covers the full request path and query string. When the client
+    already holds it (If-None-Match), a 304 is returned before the view runs,
+    so neither the query nor the JSON serialization happens. The counters are
+    read before the view's own queries, so a change racing with the request
+    can only make the next tag differ, never hide newer data behind a 304.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            with get_db_session() as session:
+                versions = get_data_versions(session, tables)
+                etag = hashlib.sha1(f"{request.full_path}|{versions}".encode()).hexdigest()
+
+                if request.if_none_match.contains_weak(etag):
+                    response = app.response_class(status=304)
+                else:
+                    response = f(*args, **kwargs)
+                    if response.status_code != 200:
+                        return response
+
+            response.set_etag(etag)
+            # Private per user and always revalidated, the browser then resends the tag on every poll
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+        return decorated_function
+    return decorator
 
 # User loader function for Flask-Login
 @login_manager.user_loader
 def load_user(user_id):
     try:
-        with get_db_session() as session:
-            technician = session.query(Technicians).filter_by(id=int(user_id)).first()
-            
-            if technician:
-                # Access attributes while session is active
-                technician_id = technician.id
-                technician_name = technician.name
-                return User(technician_id, technician_name)
+        # Served from the technician cache, so most requests do not query the database
+        technician = load_technician(int(user_id))
+        if technician:
+            technician_id, technician_name = technician
+            return User(technician_id, technician_name)
         return None
     except Exception as e:
         print(f"Error loading user {user_id}: {e}")
@@ -129,35 +214,29 @@ def login():
         username = form.username.data
         password = form.password.data
         
-        # Use your existing verify_user function
-        success, message, _ = verify_user(username, password) # type: ignore
+        # Checks the password and returns the technician in one lookup
+        success, message, technician, status_code = authenticate_technician(username, password) # type: ignore
         
         if success:
-            # Get the technician from the database
-            with get_db_session() as session:
-                technician = session.query(Technicians).filter_by(name=username).first()
-                if technician:
-                    # Access attributes while session is active
-                    technician_id = technician.id
-                    technician_name = technician.name
-                    user = User(technician_id, technician_name)
-                    login_user(user)
-                    flash('Login successful!', 'success')
-                    
-                    # Handle the next parameter safely
-                    next_page = request.args.get('next')
-                    if next_page:
-                        # Validate the next URL to prevent open redirects
-                        if urlparse(next_page).netloc == '':
-                            # Only allow relative URLs (same domain)
-                            return redirect(urljoin(request.host_url, next_page))
-                    
-                    # Default redirect to dashboard
-                    return redirect(url_for('dashboard'))
-                else:
-                    flash('User not found in database', 'error')
+            user = User(technician["id"], technician["name"])
+            login_user(user)
+            flash('Login successful!', 'success')
+            
+            # Handle the next parameter safely
+            next_page = request.args.get('next')
+            if next_page:
+                # Validate the next URL to prevent open redirects
+                if urlparse(next_page).netloc == '':
+                    # Only allow relative URLs (same domain)
+                    return redirect(urljoin(request.host_url, next_page))
+            
+            # Default redirect to dashboard
+            return redirect(url_for('dashboard'))
         else:
             flash(message, 'error')
+            if status_code == StatusCodes.service_unavailable:
+                # The password workers are saturated, ask the client to retry instead of queueing more work
+                return render_template('login.html', form=form), status_code, {'Retry-After': '5'}
     
     return render_template('login.html', form=form)
 
@@ -194,18 +273,103 @@ def api_computer_info_by_id(computer_id) -> Response:
     return json_response(computer_data)
 
 
+def computer_search_args() -> tuple:
+    """Read the filter, sort and paging query parameters of a computer card search, returning (search_computers kwargs, error)"""
+    args = request.args
+    cursor, limit, error = page_args()
+    if error:
+        return (None, error)
+    try:
+        technician_ids = [int(technician_id) for technician_id in args.getlist('technician_id')]
+        profile_id = int(args['profile_id']) if args.get('profile_id') else None
+    except ValueError:
+        return (None, "technician_id and profile_id must be integers")
+
+    deadlines = {}
+    for name in ('deadline_from', 'deadline_to'):
+        value = args.get(name)
+        if value:
+            try:
+                deadlines[name] = datetime.fromisoformat(value)
+            except ValueError:
+                return (None, f"{name} must be YYYY-MM-DD or YYYY-MM-DD HH:MM:SS")
+    # A date-only upper bound includes the whole day
+    if 'deadline_to' in deadlines and len(args['deadline_to']) == 10:
+        deadlines['deadline_to'] = deadlines['deadline_to'].replace(hour=23, minute=59, second=59)
+
+    return ({
+        "technician_ids": technician_ids, "profile_id": profile_id, "state": args.get('state') or None,
+        "deadline_from": deadlines.get('deadline_from'), "deadline_to": deadlines.get('deadline_to'),
+        "q": args.get('q', '').strip() or None, "sort": args.get('sort', 'id'),
+        "cursor": cursor, "limit": limit
+    }, None)
+
 @app.route('/api/computers', methods=['GET'])
 @login_required
 @handle_api_errors
+@etag_cached(ALL_COMPUTERS_TABLES)
 def api_computers() -> Response:
-    success, message, computers, status_code = retrieve_all_computers()
-            
+    """Get computers with their completed setup steps, technicians and attributes.
+
+    With limit or cursor a keyset page ({"computers", "limit", "next_cursor", "has_more"})
+    is returned, without either the full list, as before paging existed.
+    Paged, filtered cards are served by /api/computers/summary.
+    """
+    cursor, limit, error = page_args()
+    if error:
+        return error_response(error, 400)
+
+    if cursor is None and limit is None:
+        success, message, computers, status_code = retrieve_all_computers()
+    else:
+        success, message, computers, status_code = retrieve_computers_page(cursor, limit)
+
     if success:
-        # computers is now a list of dictionaries, not SQLAlchemy objects
+        # computers is a list of dictionaries, not SQLAlchemy objects
         return json_response(computers)
     else:
         return error_response(message, status_code)
 
+@app.route('/api/computers/summary', methods=['GET'])
+@login_required
+@handle_api_errors
+@etag_cached(COMPUTER_LIST_TABLES)
+def api_computers_summary() -> Response:
+    """Get a page of computer cards with precomputed progress counts, filtered, searched and sorted in the database.
+
+    Query parameters: technician_id (repeatable), profile_id, state, deadline_from,
+    deadline_to (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS), q (name prefix), sort, cursor, limit.
+    """
+    search_args, error = computer_search_args()
+    if error:
+        return error_response(error, 400)
+
+    success, message, page, status_code = search_computers(**search_args)
+
+    if success:
+        return json_response(page)
+    else:
+        return error_response(message, status_code)
+
+@app.route('/api/stats/progress', methods=['GET'])
+@login_required
+@handle_api_errors
+def api_progress_stats() -> Response:
+    """Get completed / in progress / not started computer counts per profile and per technician"""
+    success, message, stats, status_code = get_progress_stats()
+
+    if success:
+        return json_response(stats)
+    else:
+        return error_response(message, status_code)
+
+@app.route('/api/stats/cache', methods=['GET'])
+@login_required
+@handle_api_errors
+def api_cache_stats() -> Response:
+    """Get hit/miss counters of the in-process caches"""
+    return json_response({"user_loader": technician_cache.stats(), "reference_data": reference_cache.stats()})
+
 @app.route('/api/add_computer', methods=['POST'])
 @csrf.exempt
 @login_required
@@ -249,78 +413,133 @@ def add_api_computers():
 
     return json_response({'message': message}, status_code)
 
+@app.route('/api/add_computers', methods=['POST'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def add_api_computers_bulk():
+    """Create many computers sharing a deadline, profile and technicians, from a name list or a pattern"""
+    data = request.get_json()
+
+    names = data.get('names')
+    pattern = data.get('pattern')
+    deadline_str = data.get('deadline')
+    profile_id = data.get('profile_id')
+    technician_ids = data.get('technician_ids', [])
+
+    if not all([names or pattern, deadline_str, profile_id is not None, technician_ids]):
+        missing = []
+        if not (names or pattern): missing.append('names or pattern')
+        if not deadline_str: missing.append('deadline')
+        if profile_id is None: missing.append('profile_id')
+        if not technician_ids: missing.append('technician_ids')
+        return error_response(f"Missing parameters: {', '.join(missing)}", 400)
+
+    try:
+        deadline = datetime.strptime(deadline_str, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return error_response("Deadline must be in 'YYYY-MM-DD HH:MM:SS' format.", 400)
+
+    try:
+        profile_id = int(profile_id)
+        technician_ids = [int(tid) for tid in technician_ids]
+    except (ValueError, TypeError):
+        return error_response("profile_id and technician_ids must be valid integers.", 400)
+
+    if names is None:
+        try:
+            count = int(data.get('count', 0))
+            start = int(data.get('start', 1))
+        except (ValueError, TypeError):
+            return error_response("count and start must be valid integers.", 400)
+        names, error = expand_computer_names(pattern, count, start)
+        if error:
+            return error_response(error, 400)
+    elif not isinstance(names, list):
+        return error_response("names must be a list", 400)
+
+    success, message, results, status_code = create_computers(
+        names=names, deadline=deadline, profile_id=profile_id, technician_ids=technician_ids
+    )
+
+    response = {"success": success, "message": message}
+    if results is not None:
+        response.update(results)
+    return json_response(response, status_code)
+
+@app.route('/api/import/computers', methods=['POST'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def api_import_computers():
+    """Import computers from an uploaded CSV or JSONL file (form field 'file')"""
+    upload = request.files.get('file')
+    if not upload:
+        return error_response("Missing file upload", 400)
+
+    file_format = request.form.get('format') or detect_import_format(upload.filename or '')
+    dry_run = request.form.get('dry_run', '').lower() in ('1', 'true', 'yes', 'on')
+    try:
+        chunk_size = int(request.form.get('chunk_size', IMPORT_CHUNK_SIZE))
+    except ValueError:
+        return error_response("chunk_size must be a valid integer", 400)
+
+    # Read the upload as text row by row instead of loading it into memory
+    stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+    success, message, summary, status_code = import_computers(stream, file_format, chunk_size, dry_run)
+
+    response = {"success": success, "message": message}
+    if summary is not None:
+        response.update(summary)
+    return json_response(response, status_code)
+
+@app.route('/api/export/computers', methods=['GET'])
+@login_required
+@handle_api_errors
+def api_export_computers():
+    """Stream every computer with progress and attributes as CSV or NDJSON"""
+    file_format = request.args.get('format', 'csv').lower()
+    if file_format not in EXPORT_FORMATS:
+        return error_response("format must be csv or ndjson", 400)
+
+    # The generator keeps the request context (and its database session) alive while it streams
+    return app.response_class(
+        stream_with_context(export_computers(file_format)),
+        mimetype=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f"attachment; filename=computers.{file_format}"}
+    )
+
 @app.route('/api/profiles', methods=['GET'])
 @login_required
 @handle_api_errors
+@etag_cached(PROFILE_LIST_TABLES)
 def api_profiles() -> Response:
-    # Get profiles data directly from database with session management
-    try:
-        from config_mtrx_module.db import Profiles, SetupSteps, Computers
-        
-        with get_db_session() as session:
-            profiles = session.query(Profiles).all()
-            
-            profile_list = []
-            for profile in profiles:
-                # Access profile attributes while session is active
-                profile_id = profile.id
-                profile_name = profile.name
-                profile_description = getattr(profile, 'description', '')
-                
-                # Get steps for this profile within the same session
-                profile_steps = profile.setup_steps_to_follow
-                steps_data = []
-                for step in profile_steps:
-                    steps_data.append({
-                        "id": step.id,
-                        "name": step.name,
-                        "download_link": step.download_link
-                    })
-                
-                # Get computers using this profile
-                computers = session.query(Computers).filter_by(profile_id=profile_id).all()
-                computer_preview = []
-                for computer in computers[:3]:  # Show preview of first 3 computers
-                    computer_preview.append({
-                        "id": computer.id,
-                        "name": computer.name,
-                        "deadline": computer.deadline.isoformat() if computer.deadline else None
-                    })
-                
-                # Get preset attributes count for this profile
-                preset_attributes = profile.preset_attributes
-                attributes_count = len(preset_attributes)
-                
-                profile_list.append({
-                    "id": profile_id,
-                    "name": profile_name,
-                    "description": profile_description,
-                    "steps": steps_data,
-                    "step_count": len(steps_data),
-                    "computer_preview": computer_preview,
-                    "total_computers": len(computers),
-                    "attributes_count": attributes_count
-                })
-                
-        return json_response(profile_list)
-        
-    except Exception as e:
-        print(f"Error in api_profiles: {e}")
-        return error_response("Failed to retrieve profiles", 500)
+    """Get a page of profile cards (query parameters: cursor, limit)"""
+    cursor, limit, error = page_args()
+    if error:
+        return error_response(error, 400)
+
+    success, message, page, status_code = retrieve_profiles(cursor, limit)
+
+    if success:
+        return json_response(page)
+    else:
+        return error_response(message, status_code)
 
 @app.route('/api/technicians', methods=['GET'])
 @login_required
 @handle_api_errors
+@etag_cached(TECHNICIAN_LIST_TABLES)
 def api_technicians() -> Response:
-    success, message, technicians, status_code = retrieve_all_technicians()
+    """Get a page of technicians (query parameters: cursor, limit)"""
+    cursor, limit, error = page_args()
+    if error:
+        return error_response(error, 400)
+
+    success, message, page, status_code = retrieve_technicians(cursor, limit)
 
     if success:
-        technician_list = [{
-        "id": tech.id,
-        "name": tech.name
-        } for tech in technicians]
-        
-        return json_response(technician_list)
+        return json_response(page)
     else:
         return error_response(message, status_code)
 
@@ -478,38 +697,40 @@ def api_delete_step_from_profile(step_id: int) -> Response:
     from config_mtrx_module.steps import can_delete_step, delete_step
     from config_mtrx_module.db import SetupSteps
     
-    # Check if step can be deleted
-    success, message, can_delete, status_code = can_delete_step(step_id)
+    # Eligibility check, name lookup and delete run in one unit of work
+    with get_db_session():
+        # Check if step can be deleted
+        success, message, can_delete, status_code = can_delete_step(step_id)
     
-    if not success:
-        return json_response({
-            'success': False,
-            'message': message
-        }, status_code)
+        if not success:
+            return json_response({
+                'success': False,
+                'message': message
+            }, status_code)
     
-    if not can_delete:
-        return json_response({
-            'success': False,
-            'message': message
-        }, 409)  # Conflict
+        if not can_delete:
+            return json_response({
+                'success': False,
+                'message': message
+            }, 409)  # Conflict
     
-    # Get step name before deletion
-    try:
-        with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(id=step_id).first()
-            if not step:
-                return error_response("Step not found", 404)
-            step_name = step.name
-    except Exception as e:
-        return error_response("Error accessing step", 500)
+        # Get step name before deletion
+        try:
+            with get_db_session() as session:
+                step = session.get(SetupSteps, step_id)
+                if not step:
+                    return error_response("Step not found", 404)
+                step_name = step.name
+        except Exception as e:
+            return error_response("Error accessing step", 500)
     
-    # Delete the step
-    success, message, status_code = delete_step(step_name) # type: ignore
+        # Delete the step
+        success, message, status_code = delete_step(step_name) # type: ignore
     
-    return json_response({
-        'success': success,
-        'message': message
-    }, status_code)
+        return json_response({
+            'success': success,
+            'message': message
+        }, status_code)
 
 @app.route('/api/steps', methods=['POST'])
 @csrf.exempt
@@ -526,25 +747,27 @@ def api_create_step() -> Response:
     if not name:
         return error_response("Step name is required", 400)
     
-    success, message, status_code = create_step(name, download_link)
+    # Creating the step and reading back its ID share one unit of work
+    with get_db_session():
+        success, message, status_code = create_step(name, download_link)
     
-    # If successful, get the created step's ID
-    step_id = None
-    if success:
-        try:
-            from config_mtrx_module.db import SetupSteps
-            with get_db_session() as session:
-                step = session.query(SetupSteps).filter_by(name=name).first()
-                if step:
-                    step_id = step.id
-        except Exception as e:
-            print(f"Error retrieving created step ID: {e}")
+        # If successful, get the created step's ID
+        step_id = None
+        if success:
+            try:
+                from config_mtrx_module.db import SetupSteps
+                with get_db_session() as session:
+                    step = session.query(SetupSteps).filter_by(name=name).first()
+                    if step:
+                        step_id = step.id
+            except Exception as e:
+                print(f"Error retrieving created step ID: {e}")
     
-    return json_response({
-        'success': success,
-        'message': message,
-        'step_id': step_id
-    }, status_code)
+        return json_response({
+            'success': success,
+            'message': message,
+            'step_id': step_id
+        }, status_code)
 
 @app.route('/api/steps/create-and-add', methods=['POST'])
 @csrf.exempt
@@ -572,33 +795,35 @@ def api_create_step_and_add_to_profile() -> Response:
     except ValueError:
         return error_response("Invalid profile ID", 400)
     
-    # Create the step
-    success, message, status_code = create_step(name, download_link)
+    # Creating, looking up and attaching the step share one unit of work
+    with get_db_session():
+        # Create the step
+        success, message, status_code = create_step(name, download_link)
     
-    if not success:
-        return json_response({
-            'success': success,
-            'message': message
-        }, status_code)
+        if not success:
+            return json_response({
+                'success': success,
+                'message': message
+            }, status_code)
     
-    # Get the created step's ID
-    try:
-        with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(name=name).first()
-            if not step:
-                return error_response("Failed to retrieve created step", 500)
-            step_id = step.id
-    except Exception as e:
-        return error_response("Error retrieving created step", 500)
+        # Get the created step's ID
+        try:
+            with get_db_session() as session:
+                step = session.query(SetupSteps).filter_by(name=name).first()
+                if not step:
+                    return error_response("Failed to retrieve created step", 500)
+                step_id = step.id
+        except Exception as e:
+            return error_response("Error retrieving created step", 500)
     
-    # Add the step to the profile
-    success, message, status_code = add_step_to_profile_by_id(profile_id, step_id) # type: ignore
+        # Add the step to the profile
+        success, message, status_code = add_step_to_profile_by_id(profile_id, step_id) # type: ignore
     
-    return json_response({
-        'success': success,
-        'message': message,
-        'step_id': step_id
-    }, status_code)
+        return json_response({
+            'success': success,
+            'message': message,
+            'step_id': step_id
+        }, status_code)
 
 @app.route('/computers')
 @login_required
@@ -624,15 +849,17 @@ def setup_computer_by_id(computer_id):
 @login_required
 @handle_api_errors
 def api_computer_setup_by_id(computer_id) -> Response: # Get detailed computer setup information including steps
-    # Get basic computer info
-    computer_data = computer_info_by_id(computer_id)
-    if "Error" in computer_data:
-        return error_response(computer_data["Error"], computer_data.get("code", 500))
-            
-    # Get detailed progress information
-    progress_status, progress_data, progress_code = get_computer_progress_by_id(computer_id)
-    if not progress_status:
-        return error_response(progress_data, progress_code)
+    # One unit of work: both lookups share the session, the loaded computer row and one transaction
+    with get_db_session():
+        # Get basic computer info
+        computer_data = computer_info_by_id(computer_id)
+        if "Error" in computer_data:
+            return error_response(computer_data["Error"], computer_data.get("code", 500))
+                
+        # Get detailed progress information
+        progress_status, progress_data, progress_code = get_computer_progress_by_id(computer_id)
+        if not progress_status:
+            return error_response(progress_data, progress_code)
             
     # Steps are now already serialized as dictionaries from get_computer_progress
     completed_steps = progress_data["completed_steps"]
@@ -662,6 +889,34 @@ def api_toggle_step() -> Response: # Toggle completion status of a setup step
         "message": message
     }, status_code)
 
+@app.route('/api/steps/completion', methods=['POST'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def api_set_steps_completion() -> Response:
+    """Mark steps done ("set") or not done ("unset") on many computers at once"""
+    data = request.get_json()
+    action = data.get('action')
+    computer_ids = data.get('computer_ids')
+    step_ids = data.get('step_ids')
+
+    if action not in ('set', 'unset'):
+        return error_response("action must be 'set' or 'unset'", StatusCodes.bad_request)
+    if not isinstance(computer_ids, list) or not isinstance(step_ids, list):
+        return error_response("computer_ids and step_ids must be lists", StatusCodes.bad_request)
+    try:
+        computer_ids = [int(computer_id) for computer_id in computer_ids]
+        step_ids = [int(step_id) for step_id in step_ids]
+    except (ValueError, TypeError):
+        return error_response("computer_ids and step_ids must be valid integers", StatusCodes.bad_request)
+
+    success, message, counts, status_code = set_steps_completion(computer_ids, step_ids, action == 'set')
+
+    response = {"success": success, "message": message}
+    if counts is not None:
+        response.update(counts)
+    return json_response(response, status_code)
+
 @app.route('/api/edit_computer', methods=['POST'])
 @csrf.exempt
 @login_required
@@ -713,6 +968,31 @@ def api_edit_computer() -> Response:  # Edit computer details (name, deadline, t
         "message": message
     }, status_code)
 
+@app.route('/api/computers/assign_profile', methods=['POST'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def api_assign_profile_to_computers() -> Response:
+    """Move many computers to a profile, resetting their steps and preset attributes"""
+    data = request.get_json()
+    computer_ids = data.get('computer_ids')
+    profile_id = data.get('profile_id')
+
+    if not isinstance(computer_ids, list) or profile_id is None:
+        return error_response("computer_ids (list) and profile_id are required", 400)
+    try:
+        computer_ids = [int(computer_id) for computer_id in computer_ids]
+        profile_id = int(profile_id)
+    except (ValueError, TypeError):
+        return error_response("computer_ids and profile_id must be valid integers", 400)
+
+    success, message, results, status_code = assign_profile_to_computers(computer_ids, profile_id)
+
+    response = {"success": success, "message": message}
+    if results is not None:
+        response.update(results)
+    return json_response(response, status_code)
+
 @app.route('/api/delete_computer', methods=['POST'])
 @csrf.exempt
 @login_required
@@ -818,6 +1098,25 @@ def api_set_computer_attributes_by_id(computer_id: int) -> Response:
         "message": message
     }, status_code)
 
+@app.route('/api/computer/<int:computer_id>/attributes', methods=['PATCH'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def api_update_computer_attributes_by_id(computer_id: int) -> Response:
+    """Apply a batch of set/rename/delete attribute operations for a computer atomically"""
+    data = request.get_json()
+    operations = data.get('operations', [])
+    
+    success, message, attributes, status_code = update_computer_attributes_by_id(computer_id, operations)
+    
+    response = {
+        "success": success,
+        "message": message
+    }
+    if success:
+        response["attributes"] = attributes
+    return json_response(response, status_code)
+
 @app.route('/api/delete_profile', methods=['POST'])
 @csrf.exempt
 @login_required
@@ -841,38 +1140,17 @@ def api_delete_profile() -> Response:
 @login_required
 @handle_api_errors
 def api_profile_computers(profile_id: int) -> Response:
-    """Get all computers associated with a profile"""
-    try:
-        from config_mtrx_module.db import Profiles, Computers
-        
-        with get_db_session() as session:
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
-            
-            if not profile:
-                return error_response("Profile not found", 404)
-            
-            # Get computers for this profile
-            computers = session.query(Computers).filter_by(profile_id=profile_id).all()
-            
-            computer_list = []
-            for computer in computers:
-                computer_list.append({
-                    "id": computer.id,
-                    "name": computer.name,
-                    "deadline": computer.deadline.isoformat() if computer.deadline else None, # type: ignore
-                    "notes": computer.notes or ""
-                })
-            
-            return json_response({
-                "profile_id": profile_id,
-                "profile_name": profile.name,
-                "computers": computer_list,
-                "computer_count": len(computer_list)
-            })
-            
-    except Exception as e:
-        print(f"Error in api_profile_computers: {e}")
-        return error_response("Failed to retrieve profile computers", 500)
+    """Get a page of the computers associated with a profile (query parameters: cursor, limit)"""
+    cursor, limit, error = page_args()
+    if error:
+        return error_response(error, 400)
+
+    success, message, page, status_code = retrieve_profile_computers(profile_id, cursor, limit)
+
+    if success:
+        return json_response(page)
+    else:
+        return error_response(message, status_code)
 
 @app.route('/api/profile/<int:profile_id>/delete', methods=['DELETE'])
 @csrf.exempt
@@ -883,17 +1161,17 @@ def api_delete_profile_by_id(profile_id: int) -> Response:
     try:
         from config_mtrx_module.db import Profiles
         
-        # First get the profile name
+        # First get the profile name, the delete below joins the same unit of work
         with get_db_session() as session:
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            profile = session.get(Profiles, profile_id)
             
             if not profile:
                 return error_response("Profile not found", 404)
             
             profile_name = profile.name
         
-        # Now delete using the existing function
-        success, message, status_code = delete_profile(profile_name) # type: ignore
+            # Now delete using the existing function
+            success, message, status_code = delete_profile(profile_name) # type: ignore
         
         return json_response({
             "success": success,
@@ -971,7 +1249,14 @@ def api_set_profile_attribute(profile_name: str, key: str) -> Response:
     data = request.get_json()
     value = data.get('value', '')
     
-    success, message, status_code = set_profile_attribute(profile_name, key, value)
+    propagate, override_policy, error = propagation_args(data)
+    if error:
+        return error_response(error, 400)
+    
+    success, message, status_code = set_profile_attribute(
+        profile_name, key, value,
+        propagate=propagate, override_policy=override_policy
+    )
     
     return json_response({
         "success": success,
@@ -1007,13 +1292,48 @@ def api_set_profile_attributes(profile_name: str) -> Response:
     if not isinstance(attributes, dict):
         return error_response("Attributes must be a dictionary", 400)
     
-    success, message, status_code = set_profile_attributes(profile_name, attributes)
+    propagate, override_policy, error = propagation_args(data)
+    if error:
+        return error_response(error, 400)
+    
+    success, message, status_code = set_profile_attributes(
+        profile_name, attributes,
+        propagate=propagate, override_policy=override_policy
+    )
     
     return json_response({
         "success": success,
         "message": message
     }, status_code)
 
+@app.route('/api/profile/<profile_name>/attributes', methods=['PATCH'])
+@csrf.exempt
+@login_required
+@handle_api_errors
+def api_update_profile_attributes(profile_name: str) -> Response:
+    """Apply a batch of set/rename/delete preset attribute operations for a profile atomically"""
+    from config_mtrx_module.profiles import update_profile_attributes
+    
+    data = request.get_json()
+    operations = data.get('operations', [])
+    
+    propagate, override_policy, error = propagation_args(data)
+    if error:
+        return error_response(error, 400)
+    
+    success, message, attributes, status_code = update_profile_attributes(
+        profile_name, operations,
+        propagate=propagate, override_policy=override_policy
+    )
+    
+    response = {
+        "success": success,
+        "message": message
+    }
+    if success:
+        response["attributes"] = attributes
+    return json_response(response, status_code)
+
 
 # Used for user logout. When the user logs out they are redirected to the login page
 @app.route('/logout')
@@ -0,0 +1,102 @@
+"""SQLite concurrency benchmark: default connection settings vs the tuned pragmas.
+
+Seeds a throwaway database, then runs reader threads (the /api/computers query
+path) and writer threads (step toggles) against it for a fixed time, once with
+SQLite's defaults and once with the pragmas from config_mtrx_module.config.
+
+Usage: python benchmark_db.py [--computers 2000] [--readers 8] [--writers 4] [--seconds 5]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from config_mtrx_module.config import SQLITE_PRAGMAS
+from config_mtrx_module.db import (
+    Computers, SetupSteps, Profiles, configure_sqlite_connection, init_db,
+    computer_step_association, profile_step_association
+)
+from config_mtrx_module.computers import load_computer_relations
+
+def seed_database(target_engine, computer_count: int, step_count: int = 20) -> None:
+    """Create the schema and a profile with steps shared by computer_count computers"""
+    init_db(target_engine)
+    with target_engine.begin() as connection:
+        connection.execute(insert(SetupSteps), [{"name": f"Step {i}"} for i in range(step_count)])
+        connection.execute(insert(Profiles), [{"name": "Benchmark profile"}])
+        connection.execute(insert(profile_step_association), [{"profile_id": 1, "step_id": i + 1} for i in range(step_count)])
+        connection.execute(insert(Computers), [{"name": f"Computer {i}", "profile_id": 1} for i in range(computer_count)])
+
+def run_workload(target_engine, computer_count: int, readers: int, writers: int, seconds: float) -> dict:
+    """Run readers and writers concurrently and count completed operations and lock errors"""
+    Session = sessionmaker(bind=target_engine)
+    stop_at = time.perf_counter() + seconds
+    results = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def record(key):
+        with lock:
+            results[key] += 1
+
+    def reader():
+        while time.perf_counter() < stop_at:
+            try:
+                with Session() as session:
+                    session.execute(select(Computers.id, Computers.name)).all()
+                    load_computer_relations(session)
+                record("reads")
+            except OperationalError:
+                record("locked")
+
+    def writer(offset):
+        toggle = 0
+        while time.perf_counter() < stop_at:
+            computer_id = (toggle * writers + offset) % computer_count + 1
+            toggle += 1
+            try:
+                with Session.begin() as session:
+                    session.execute(delete(computer_step_association).where(
+                        computer_step_association.c.computer_id == computer_id
+                    ))
+                    session.execute(insert(computer_step_association), [{"computer_id": computer_id, "step_id": 1}])
+                record("writes")
+            except OperationalError:
+                record("locked")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def benchmark(label: str, pragmas: dict | None, args) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        target_engine = create_engine(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+        if pragmas:
+            configure_sqlite_connection(target_engine, pragmas)
+        seed_database(target_engine, args.computers)
+        results = run_workload(target_engine, args.computers, args.readers, args.writers, args.seconds)
+        target_engine.dispose()
+
+    print(f"{label:<8} reads/s: {results['reads'] / args.seconds:8.1f}   "
+          f"writes/s: {results['writes'] / args.seconds:8.1f}   "
+          f"'database is locked' errors: {results['locked']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare SQLite concurrency with and without the tuned pragmas")
+    parser.add_argument("--computers", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{args.computers} computers, {args.readers} readers, {args.writers} writers, {args.seconds:g}s per run")
+    benchmark("default", None, args)
+    benchmark("tuned", SQLITE_PRAGMAS, args)
@@ -0,0 +1,2 @@
+# Register the session hooks that keep the per-table change counters (ETags) in step with every write
+from . import versions
@@ -0,0 +1,219 @@
+### Custom module imports:
+from .db import Computers, Profiles, ComputerAttributes, ProfileAttributes
+from sqlalchemy import select, insert, update, delete, exists, bindparam
+
+# Attribute table, owner foreign key and owner relationship for each attribute owner
+ATTRIBUTE_TABLES = {
+    Computers: (ComputerAttributes, 'computer_id', 'attributes'),
+    Profiles: (ProfileAttributes, 'profile_id', 'preset_attributes'),
+}
+
+def diff_attributes(existing: dict, attributes: dict) -> tuple:
+    """Split a replacement attribute sheet into the keys to create, update and delete"""
+    created = [key for key in attributes if key not in existing]
+    updated = [key for key in attributes if key in existing]
+    deleted = [key for key in existing if key not in attributes]
+    return (created, updated, deleted)
+
+def load_attribute_rows(session, owner) -> dict:
+    """Read the (id, key, value) rows of a computer's or profile's attributes, keyed by attribute key"""
+    model, owner_column, _ = ATTRIBUTE_TABLES[type(owner)]
+    return {
+        row.key: row
+        for row in session.execute(
+            select(model.id, model.key, model.value).where(getattr(model, owner_column) == owner.id)
+        )
+    }
+
+def replace_attributes(session, owner, attributes: dict, existing: dict = None) -> tuple:
+    """Replace every attribute of a computer or profile with the given key/value sheet.
+
+    Existing rows are read once (or taken from `existing`, as returned by
+    load_attribute_rows), the diff is computed in memory and applied with
+    at most one bulk DELETE, UPDATE and INSERT, whatever the number of keys.
+    Only keys whose value actually changed are written. Returns the
+    (created, updated, deleted) key lists.
+    """
+    model, owner_column, relationship_name = ATTRIBUTE_TABLES[type(owner)]
+    owner_id = owner.id
+
+    if existing is None:
+        existing = load_attribute_rows(session, owner)
+    created, updated, deleted = diff_attributes(existing, attributes)
+
+    # Deletes go first so a key freed by a rename can be reused in the same flush
+    if deleted:
+        session.execute(
+            delete(model).where(model.id.in_([existing[key].id for key in deleted])),
+            execution_options={"synchronize_session": False}
+        )
+
+    changed = [
+        {"id": existing[key].id, "value": attributes[key]}
+        for key in updated
+        if existing[key].value != attributes[key]
+    ]
+    if changed:
+        session.execute(update(model), changed)
+
+    if created:
+        session.execute(insert(model), [
+            {owner_column: owner_id, "key": key, "value": attributes[key]}
+            for key in created
+        ])
+
+    # The bulk statements bypass the relationship, reload it on next access
+    session.expire(owner, [relationship_name])
+    return (created, updated, deleted)
+
+def resolve_attribute_operations(attributes: dict, operations: list) -> tuple:
+    """Apply a list of set/rename/delete operations, in order, to a copy of an attribute sheet.
+
+    Operations look like {"op": "set", "key": k, "value": v},
+    {"op": "rename", "key": k, "new_key": k2} (optionally with a new "value")
+    and {"op": "delete", "key": k}. Returns (resulting sheet, error message);
+    the sheet is None and the message says which operation failed when any
+    operation is invalid, so nothing is written.
+    """
+    if not isinstance(operations, list):
+        return (None, "Operations must be a list")
+
+    result = dict(attributes)
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            return (None, f"Operation {index} must be an object")
+
+        op = operation.get('op')
+        key = operation.get('key')
+        if not isinstance(key, str) or not key.strip():
+            return (None, f"Operation {index}: key must be a non-empty string")
+
+        if op == 'set':
+            value = operation.get('value')
+            if not isinstance(value, str):
+                return (None, f"Operation {index}: value must be a string")
+            result[key] = value
+        elif op == 'rename':
+            new_key = operation.get('new_key')
+            if not isinstance(new_key, str) or not new_key.strip():
+                return (None, f"Operation {index}: new_key must be a non-empty string")
+            if key not in result:
+                return (None, f"Operation {index}: attribute '{key}' not found")
+            if new_key != key and new_key in result:
+                return (None, f"Operation {index}: attribute '{new_key}' already exists")
+            value = operation.get('value', result[key])
+            if not isinstance(value, str):
+                return (None, f"Operation {index}: value must be a string")
+            del result[key]
+            result[new_key] = value
+        elif op == 'delete':
+            if key not in result:
+                return (None, f"Operation {index}: attribute '{key}' not found")
+            del result[key]
+        else:
+            return (None, f"Operation {index}: unknown op '{op}', expected set, rename or delete")
+
+    return (result, None)
+
+def apply_attribute_operations(session, owner, operations: list, existing: dict = None) -> tuple:
+    """Apply set/rename/delete operations to a computer's or profile's attributes in one pass.
+
+    The current rows are read once, the operations are resolved in memory and
+    the net result is written with replace_attributes, so a batch of any size
+    costs the same handful of statements. Returns (attributes, changes, error)
+    where changes is the (created, updated, deleted) tuple; on a validation
+    error nothing is written and attributes and changes are None.
+    """
+    if existing is None:
+        existing = load_attribute_rows(session, owner)
+    attributes, error = resolve_attribute_operations(
+        {key: row.value for key, row in existing.items()}, operations
+    )
+    if error:
+        return (None, None, error)
+
+    changes = replace_attributes(session, owner, attributes, existing)
+    return (attributes, changes, None)
+
+# How preset changes reach computers whose value differs from the old preset:
+# 'keep' leaves local overrides alone, 'overwrite' replaces them
+PROPAGATION_POLICIES = ('keep', 'overwrite')
+
+def propagate_preset_changes(session, profile_id: int, previous: dict, current: dict, policy: str = 'keep') -> dict:
+    """Push a profile's preset attribute changes onto the computers using that profile.
+
+    previous and current are the profile's key -> value presets before and
+    after the change. Changed or new keys are written with one executemany
+    UPDATE and one executemany INSERT ... SELECT (for computers missing the
+    key), removed keys with one executemany DELETE, however many computers
+    use the profile. With policy 'keep' only rows still holding the old preset
+    value are updated or removed, so locally overridden values survive; with
+    'overwrite' every computer of the profile ends up with the new preset.
+    Returns the number of computer attribute rows updated, inserted and deleted.
+    """
+    table = ComputerAttributes.__table__
+    profile_computers = select(Computers.id).where(Computers.profile_id == profile_id).scalar_subquery()
+    in_profile = table.c.computer_id.in_(profile_computers)
+
+    changed = [
+        {"attr_key": key, "old_value": previous.get(key), "new_value": value}
+        for key, value in current.items()
+        # A new key counts as changed even when its value is None
+        if key not in previous or previous[key] != value
+    ]
+    removed = [
+        {"attr_key": key, "old_value": value}
+        for key, value in previous.items()
+        if key not in current
+    ]
+    counts = {"updated": 0, "inserted": 0, "deleted": 0}
+
+    if changed:
+        update_filter = [in_profile, table.c.key == bindparam('attr_key')]
+        # Values are nullable, = and != are never true when either side is NULL
+        if policy == 'keep':
+            update_filter.append(table.c.value.is_not_distinct_from(bindparam('old_value')))
+        else:
+            update_filter.append(table.c.value.is_distinct_from(bindparam('new_value')))
+        counts["updated"] = session.execute(
+            update(table).where(*update_filter).values(value=bindparam('new_value')), changed
+        ).rowcount
+
+        # Computers of the profile that do not have the key at all get a copy of the preset
+        missing_key = ~exists().where(table.c.computer_id == Computers.id, table.c.key == bindparam('attr_key'))
+        counts["inserted"] = session.execute(
+            insert(table).from_select(
+                ['computer_id', 'key', 'value'],
+                select(Computers.id, bindparam('attr_key'), bindparam('new_value'))
+                .where(Computers.profile_id == profile_id, missing_key)
+            ),
+            [{"attr_key": change["attr_key"], "new_value": change["new_value"]} for change in changed]
+        ).rowcount
+
+    if removed:
+        delete_filter = [in_profile, table.c.key == bindparam('attr_key')]
+        if policy == 'keep':
+            delete_filter.append(table.c.value.is_not_distinct_from(bindparam('old_value')))
+        counts["deleted"] = session.execute(delete(table).where(*delete_filter), removed).rowcount
+
+    return counts
+
+def describe_propagation(counts: dict) -> str:
+    """Summarize propagate_preset_changes() counts for a response message"""
+    return (f" Propagated to computers: {counts['updated']} updated, "
+            f"{counts['inserted']} added, {counts['deleted']} removed.")
+
+def describe_attribute_changes(target: str, created: list, updated: list, deleted: list) -> str:
+    """Build the summary message returned by the set_*_attributes functions"""
+    message_parts = []
+    if created:
+        message_parts.append(f"Created attributes: {', '.join(created)}")
+    if updated:
+        message_parts.append(f"Updated attributes: {', '.join(updated)}")
+    if deleted:
+        message_parts.append(f"Deleted attributes: {', '.join(deleted)}")
+
+    if message_parts:
+        return f"Attributes set for {target}. " + "; ".join(message_parts)
+    else:
+        return f"No changes made to attributes for {target}"
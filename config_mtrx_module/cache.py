@@ -0,0 +1,80 @@
+### General imports:
+import threading
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries also expire ttl seconds after being stored.
+
+    A max_size or ttl of 0 disables the cache: every lookup is a miss and
+    nothing is stored. Every invalidation bumps `generation`; a caller that
+    reads the generation before loading a value and passes it to set() never
+    stores a value loaded before a concurrent invalidation.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key) -> tuple:
+        """Return (found, value) for key, dropping the entry if it has expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return (True, value)
+                del self._entries[key]
+            self._counters["misses"] += 1
+            return (False, None)
+
+    def set(self, key, value, generation: int | None = None) -> None:
+        """Store value for key, unless the cache is disabled or was invalidated since generation was read"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, *keys) -> None:
+        """Drop the given keys"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            self.generation += 1
+            self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self._counters["invalidations"] += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size, for the metrics endpoint"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                **self._counters,
+                "hit_ratio": round(self._counters["hits"] / lookups, 4) if lookups else None,
+            }
@@ -1,7 +1,32 @@
 ### Custom module imports:
-from .db import Computers, SetupSteps, Technicians, ComputerAttributes, get_db_session
+from .db import (
+    Computers, SetupSteps, Technicians, ComputerAttributes, Profiles, ProfileAttributes, get_db_session,
+    computer_step_association, computer_technician_association
+)
 from .utils import StatusCodes
+from .progress import load_progress_counts, load_progress_steps, computer_progress_subquery
+from .pagination import clamp_page_size, encode_cursor, decode_cursor, fetch_keyset_page
+from .attributes import replace_attributes, apply_attribute_operations, describe_attribute_changes
 from datetime import datetime
+from collections import defaultdict
+from sqlalchemy import select, insert, update, delete, func, and_, or_, exists
+from sqlalchemy.orm import object_session
+
+# Completion states accepted by search_computers, matching the progress statistics
+COMPLETION_STATES = ('completed', 'incomplete', 'in_progress', 'not_started')
+# Sort keys accepted by search_computers (prefix with '-' for descending order)
+COMPUTER_SORT_KEYS = ('id', 'name', 'deadline')
+# Computers without a deadline sort after every real deadline
+NO_DEADLINE_SORT_VALUE = datetime(9999, 12, 31)
+
+# Upper bound on the number of computers created by one bulk request
+BULK_CREATE_MAX_COMPUTERS = 1000
+# Names checked per IN (...) lookup, kept well below SQLite's bound parameter limit
+NAME_LOOKUP_CHUNK_SIZE = 500
+# Upper bound on computer x step pairs changed by one bulk completion request
+BULK_STEP_MAX_PAIRS = 20000
+# Computers moved per transaction by a bulk profile reassignment
+REASSIGN_CHUNK_SIZE = 200
 
 def get_computer_by(computer_name: str = '', computer_technician: str = '') -> tuple:
     with get_db_session() as session:
@@ -55,6 +80,34 @@ def get_computer_deadline(computer_name: str) -> tuple:
         print(e)
         return (False, "Error retrieving computer deadline", None, StatusCodes.internal_server_error)
 
+def toggle_computer_step(session, computer, step_name: str) -> bool | None:
+    """Flip one step of a computer between done and not done, returning True if it is now done.
+
+    The step id is read in the caller's transaction (never from a cache, so a
+    step just created, deleted or renamed by another process resolves
+    correctly) and the association row is checked and written directly,
+    without loading the step or the computer's completed steps. Returns None
+    if the step does not exist.
+    """
+    step_id = session.scalar(select(SetupSteps.id).where(SetupSteps.name == step_name))
+    if step_id is None:
+        return None
+
+    pair = (
+        computer_step_association.c.computer_id == computer.id,
+        computer_step_association.c.step_id == step_id
+    )
+    if session.execute(select(exists().where(*pair))).scalar():
+        session.execute(delete(computer_step_association).where(*pair))
+        completed = False
+    else:
+        session.execute(insert(computer_step_association).values(computer_id=computer.id, step_id=step_id))
+        completed = True
+
+    # The association row was written directly, reload setup_steps on next access
+    session.expire(computer, ['setup_steps'])
+    return completed
+
 def toggle_step(computer_name: str, step_name: str) -> tuple: 
     try:
         with get_db_session() as session:
@@ -63,40 +116,153 @@ def toggle_step(computer_name: str, step_name: str) -> tuple:
             if not computer:
                 return (False, f"Computer '{computer_name}' not found", StatusCodes.not_found)
             
-            # Finding step
-            step = session.query(SetupSteps).filter_by(name=step_name).first()
-            if not step:
+            completed = toggle_computer_step(session, computer, step_name)
+            if completed is None:
                 return (False, f"Setup step '{step_name}' not found", StatusCodes.not_found)
             
-            if step in computer.setup_steps: # Remove existing step
-                computer.setup_steps.remove(step)
-                return (True, f"Step '{step_name}' removed from: '{computer_name}'", StatusCodes.success)
-            else: # Add existing step
-                computer.setup_steps.append(step) 
+            if completed:
                 return (True, f"Marked step '{step_name}' as complete for '{computer_name}'", StatusCodes.success)
+            else:
+                return (True, f"Step '{step_name}' removed from: '{computer_name}'", StatusCodes.success)
     except Exception as e:
         print(e)
         return (False, "Error changing step value", StatusCodes.internal_server_error)
 
+def set_steps_completion(computer_ids: list, step_ids: list, completed: bool) -> tuple:
+    """Mark every step in step_ids as done (or not done) on every computer in computer_ids.
+
+    Idempotent: pairs already in the requested state are left alone. Marking
+    done reads the existing pairs once and inserts the missing ones with a
+    single executemany INSERT, un-marking is a single DELETE.
+    """
+    try:
+        computer_ids = list(dict.fromkeys(computer_ids))
+        step_ids = list(dict.fromkeys(step_ids))
+        if not computer_ids or not step_ids:
+            return (False, "computer_ids and step_ids cannot be empty", None, StatusCodes.bad_request)
+        if len(computer_ids) * len(step_ids) > BULK_STEP_MAX_PAIRS:
+            return (False, f"At most {BULK_STEP_MAX_PAIRS} computer/step pairs can be changed per request", None, StatusCodes.bad_request)
+
+        with get_db_session() as session:
+            found_computers = set(session.scalars(select(Computers.id).where(Computers.id.in_(computer_ids))))
+            missing_computers = [computer_id for computer_id in computer_ids if computer_id not in found_computers]
+            if missing_computers:
+                return (False, f"Computers not found: {', '.join(map(str, missing_computers))}", None, StatusCodes.not_found)
+
+            found_steps = set(session.scalars(select(SetupSteps.id).where(SetupSteps.id.in_(step_ids))))
+            missing_steps = [step_id for step_id in step_ids if step_id not in found_steps]
+            if missing_steps:
+                return (False, f"Setup steps not found: {', '.join(map(str, missing_steps))}", None, StatusCodes.not_found)
+
+            pair_filter = (
+                computer_step_association.c.computer_id.in_(computer_ids),
+                computer_step_association.c.step_id.in_(step_ids)
+            )
+            if completed:
+                done = set(session.execute(
+                    select(computer_step_association.c.computer_id, computer_step_association.c.step_id).where(*pair_filter)
+                ).all())
+                new_pairs = [
+                    {"computer_id": computer_id, "step_id": step_id}
+                    for computer_id in computer_ids for step_id in step_ids
+                    if (computer_id, step_id) not in done
+                ]
+                if new_pairs:
+                    session.execute(insert(computer_step_association), new_pairs)
+                changed = len(new_pairs)
+            else:
+                changed = session.execute(delete(computer_step_association).where(*pair_filter)).rowcount
+
+            # The association rows were written directly, reload setup_steps on next access
+            for computer_id in computer_ids:
+                computer = session.identity_map.get(session.identity_key(Computers, computer_id))
+                if computer is not None:
+                    session.expire(computer, ['setup_steps'])
+
+            total = len(computer_ids) * len(step_ids)
+            state = "complete" if completed else "incomplete"
+            message = f"Marked {changed} step(s) {state} across {len(computer_ids)} computer(s), {total - changed} already {state}"
+            return (True, message, {"changed": changed, "unchanged": total - changed}, StatusCodes.success)
+
+    except Exception as e:
+        print(e)
+        return (False, "Error changing step completion", None, StatusCodes.internal_server_error)
+
+def load_computer_technicians(session, computer_ids: list | None = None) -> dict:
+    """Read the assigned technicians of many computers in a single query, keyed by computer id"""
+    technician_query = (
+        select(computer_technician_association.c.computer_id, Technicians.id, Technicians.name)
+        .join(Technicians, Technicians.id == computer_technician_association.c.technician_id)
+    )
+    if computer_ids is not None:
+        technician_query = technician_query.where(computer_technician_association.c.computer_id.in_(computer_ids))
+
+    technicians_by_computer = defaultdict(list)
+    for computer_id, technician_id, technician_name in session.execute(technician_query):
+        technicians_by_computer[computer_id].append({'id': technician_id, 'name': technician_name})
+    return technicians_by_computer
+
+def load_computer_attributes(session, computer_ids: list | None = None) -> dict:
+    """Read the custom attributes of many computers in a single query, keyed by computer id"""
+    attribute_query = select(ComputerAttributes.computer_id, ComputerAttributes.key, ComputerAttributes.value)
+    if computer_ids is not None:
+        attribute_query = attribute_query.where(ComputerAttributes.computer_id.in_(computer_ids))
+
+    attributes_by_computer = defaultdict(dict)
+    for computer_id, key, value in session.execute(attribute_query.order_by(ComputerAttributes.id)):
+        attributes_by_computer[computer_id][key] = value
+    return attributes_by_computer
+
+def load_computer_relations(session, computer_ids: list | None = None) -> tuple:
+    """Read completed steps, technicians and attributes for many computers at once.
+
+    Runs three set-based queries (one per relationship) instead of lazy-loading
+    each relationship per computer. When computer_ids is None every row is read.
+    Returns three dicts keyed by computer id.
+    """
+    step_query = select(computer_step_association.c.computer_id, computer_step_association.c.step_id)
+    if computer_ids is not None:
+        step_query = step_query.where(computer_step_association.c.computer_id.in_(computer_ids))
+
+    steps_by_computer = defaultdict(list)
+    for computer_id, step_id in session.execute(step_query):
+        steps_by_computer[computer_id].append(step_id)
+
+    technicians_by_computer = load_computer_technicians(session, computer_ids)
+    attributes_by_computer = load_computer_attributes(session, computer_ids)
+
+    return (steps_by_computer, technicians_by_computer, attributes_by_computer)
+
+def serialize_full_computers(session, computers: list, computer_ids: list | None = None) -> list:
+    """Serialize computer rows with their completed step ids, technicians and attributes.
+
+    Relations are read with one query each for computer_ids (every computer when None).
+    """
+    steps_by_computer, technicians_by_computer, attributes_by_computer = load_computer_relations(session, computer_ids)
+    return [
+        {
+            'id': computer.id,
+            'name': computer.name,
+            'profile_id': computer.profile_id,
+            'deadline': computer.deadline.isoformat() if computer.deadline else None,
+            'notes': computer.notes,
+            'setup_steps': steps_by_computer.get(computer.id, []),  # Serialize related setup steps
+            'technicians': technicians_by_computer.get(computer.id, []),  # Serialize related technicians with names
+            'attributes': attributes_by_computer.get(computer.id, {})  # Serialize custom attributes
+        }
+        for computer in computers
+    ]
+
+def full_computer_query():
+    return select(Computers.id, Computers.name, Computers.profile_id, Computers.deadline, Computers.notes)
+
 def retrieve_all_computers() -> tuple:
     try: 
         with get_db_session() as session:
-            # Retrieving all computers
-            computers = session.query(Computers).all()
+            # Retrieving all computers as plain rows, relationships are read in bulk below
+            computers = session.execute(full_computer_query().order_by(Computers.id)).all()
             if computers:
-                serialized_computers = [
-                    {
-                        'id': computer.id,
-                        'name': computer.name,
-                        'profile_id': computer.profile_id,
-                        'deadline': computer.deadline.isoformat() if computer.deadline else None, # type: ignore
-                        'notes': computer.notes,
-                        'setup_steps': [step.id for step in computer.setup_steps],  # Serialize related setup steps
-                        'technicians': [{'id': tech.id, 'name': tech.name} for tech in computer.technicians],  # Serialize related technicians with names
-                        'attributes': {attr.key: attr.value for attr in computer.attributes}  # Serialize custom attributes
-                    }
-                    for computer in computers
-                ]
+                serialized_computers = serialize_full_computers(session, computers)
                 return (True, "Computers retrieved successfully", serialized_computers, StatusCodes.success)
             else:
                 return (True, "No computers have been created yet", [], StatusCodes.success)
@@ -104,6 +270,149 @@ def retrieve_all_computers() -> tuple:
         print(e)
         return (False, "An error occurred while mapping computers", [], StatusCodes.internal_server_error)
 
+def retrieve_computers_page(cursor: str | None = None, limit: int | None = None) -> tuple:
+    """Get one page of computers in the retrieve_all_computers() format, keyset-paginated on id"""
+    try:
+        with get_db_session() as session:
+            computers, page, error = fetch_keyset_page(session, full_computer_query(), Computers.id, cursor, limit)
+            if error:
+                return (False, error, None, StatusCodes.bad_request)
+            serialized_computers = serialize_full_computers(session, computers, [computer.id for computer in computers])
+            return (True, "Computers retrieved successfully", {"computers": serialized_computers, **page}, StatusCodes.success)
+    except Exception as e:
+        print(e)
+        return (False, "An error occurred while mapping computers", None, StatusCodes.internal_server_error)
+
+def computer_card_query():
+    """Base query for computer cards: id, name, deadline and profile"""
+    return (
+        select(Computers.id, Computers.name, Computers.deadline, Computers.profile_id, Profiles.name.label('profile_name'))
+        .outerjoin(Profiles, Profiles.id == Computers.profile_id)
+    )
+
+def serialize_computer_cards(session, computers: list) -> list:
+    """Build computer cards (profile, technicians, deadline, progress counts) for rows of computer_card_query()"""
+    computer_ids = [computer.id for computer in computers]
+    technicians_by_computer = load_computer_technicians(session, computer_ids)
+    progress_by_computer = load_progress_counts(session, computer_ids) if computer_ids else {}
+
+    serialized_computers = []
+    for computer in computers:
+        serialized_computers.append({
+            "id": computer.id,
+            "name": computer.name,
+            "profile": {"name": computer.profile_name, "id": computer.profile_id} if computer.profile_id is not None else None,
+            "technicians": technicians_by_computer.get(computer.id, []),
+            "deadline": computer.deadline.strftime("%Y-%m-%d %H:%M:%S") if computer.deadline else None,
+            **progress_by_computer[computer.id]
+        })
+    return serialized_computers
+
+def completion_state_filter(state: str):
+    """WHERE clause selecting computers in a completion state, evaluated on computer_progress_subquery()"""
+    progress = computer_progress_subquery()
+    is_completed = and_(progress.c.total_steps > 0, progress.c.completed_steps == progress.c.total_steps)
+    conditions = {
+        'completed': is_completed,
+        'incomplete': ~is_completed,
+        'in_progress': and_(progress.c.completed_steps > 0, ~is_completed),
+        'not_started': progress.c.completed_steps == 0,
+    }
+    return Computers.id.in_(select(progress.c.computer_id).where(conditions[state]))
+
+def search_computers(technician_ids: list | None = None, profile_id: int | None = None, state: str | None = None,
+                     deadline_from: datetime | None = None, deadline_to: datetime | None = None, q: str | None = None,
+                     sort: str = 'id', cursor: str | None = None, limit: int | None = None) -> tuple:
+    """Get one page of computer cards matching the filters, with keyset pagination.
+
+    Every filter is evaluated in SQL: technician_ids matches computers assigned
+    to any of them, state is one of COMPLETION_STATES, the deadline range is
+    inclusive and q is a case-insensitive name prefix. Pages are ordered by the
+    sort key then id, and next_cursor (None on the last page) continues right
+    after the last row returned, so the cost of a page does not depend on how
+    far into the list it is.
+    """
+    try:
+        descending = sort.startswith('-')
+        sort_key = sort.lstrip('-')
+        if sort_key not in COMPUTER_SORT_KEYS:
+            return (False, f"sort must be one of: {', '.join(COMPUTER_SORT_KEYS)} (prefix with '-' for descending)", None, StatusCodes.bad_request)
+        if state is not None and state not in COMPLETION_STATES:
+            return (False, f"state must be one of: {', '.join(COMPLETION_STATES)}", None, StatusCodes.bad_request)
+        limit = clamp_page_size(limit)
+
+        sort_columns = {
+            'id': Computers.id,
+            'name': Computers.name,
+            'deadline': func.coalesce(Computers.deadline, NO_DEADLINE_SORT_VALUE),
+        }
+        sort_column = sort_columns[sort_key]
+
+        query = computer_card_query()
+        if technician_ids:
+            query = query.where(exists().where(
+                computer_technician_association.c.computer_id == Computers.id,
+                computer_technician_association.c.technician_id.in_(technician_ids)
+            ))
+        if profile_id is not None:
+            query = query.where(Computers.profile_id == profile_id)
+        if state is not None:
+            query = query.where(completion_state_filter(state))
+        if deadline_from is not None:
+            query = query.where(Computers.deadline >= deadline_from)
+        if deadline_to is not None:
+            query = query.where(Computers.deadline <= deadline_to)
+        if q:
+            escaped = q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            query = query.where(Computers.name.ilike(f"{escaped}%", escape='\\'))
+
+        if cursor:
+            values = decode_cursor(cursor)
+            if not values or len(values) != 2 or not isinstance(values[1], int):
+                return (False, "Invalid cursor", None, StatusCodes.bad_request)
+            last_value, last_id = values
+            if sort_key == 'deadline':
+                try:
+                    last_value = datetime.fromisoformat(last_value)
+                except (ValueError, TypeError):
+                    return (False, "Invalid cursor", None, StatusCodes.bad_request)
+            after = (lambda column, value: column < value) if descending else (lambda column, value: column > value)
+            if sort_key == 'id':
+                query = query.where(after(Computers.id, last_id))
+            else:
+                query = query.where(or_(
+                    after(sort_column, last_value),
+                    and_(sort_column == last_value, after(Computers.id, last_id))
+                ))
+
+        if descending:
+            query = query.order_by(sort_column.desc(), Computers.id.desc())
+        else:
+            query = query.order_by(sort_column, Computers.id)
+        query = query.add_columns(sort_column.label('sort_value'))
+
+        with get_db_session() as session:
+            # One extra row tells whether another page follows
+            rows = session.execute(query.limit(limit + 1)).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            next_cursor = None
+            if has_more:
+                last = rows[-1]
+                sort_value = last.sort_value.isoformat() if sort_key == 'deadline' else last.sort_value
+                next_cursor = encode_cursor([sort_value, last.id])
+
+            return (True, "Computers retrieved successfully", {
+                "computers": serialize_computer_cards(session, rows),
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "has_more": has_more
+            }, StatusCodes.success)
+    except Exception as e:
+        print(e)
+        return (False, "An error occurred while searching computers", None, StatusCodes.internal_server_error)
+
 def edit_computer_name(current_name: str, new_name: str) -> tuple:
     try:
         with get_db_session() as session:
@@ -147,6 +456,17 @@ def edit_computer_deadline(computer_name: str, new_deadline: datetime) -> tuple:
         print(e)
         return (False, f"Error updating computer deadline", StatusCodes.internal_server_error)
 
+def serialize_progress_steps(steps) -> list:
+    """Serialize (id, name, download_link) step rows to prevent session binding issues"""
+    return [
+        {
+            "id": step.id,
+            "name": step.name,
+            "download_link": step.download_link
+        }
+        for step in steps
+    ]
+
 def get_computer_progress(computer_name: str) -> tuple:
     try:
         with get_db_session() as session:
@@ -154,37 +474,14 @@ def get_computer_progress(computer_name: str) -> tuple:
             if not computer: # Handle computer not existing
                 return (False, f"Computer '{computer_name}' not found", StatusCodes.not_found)
 
-            completed_steps = computer.setup_steps
-            profile = computer.profile
-
-            if not profile:
+            if computer.profile_id is None:
                 return (False, f"No profile associated with '{computer_name}'", StatusCodes.not_found)
 
-            total_steps = profile.setup_steps_to_follow
-            remaining_steps = [step for step in total_steps if step not in completed_steps]
-
-            # Serialize the steps data to prevent session binding issues
-            completed_steps_data = [
-                {
-                    "id": step.id,
-                    "name": step.name,
-                    "download_link": step.download_link
-                }
-                for step in completed_steps
-            ]
-            
-            remaining_steps_data = [
-                {
-                    "id": step.id,
-                    "name": step.name,
-                    "download_link": step.download_link
-                }
-                for step in remaining_steps
-            ]
+            completed_steps, remaining_steps = load_progress_steps(session, computer.id, computer.profile_id)
 
             return (True, {
-                "completed_steps": completed_steps_data,
-                "remaining_steps": remaining_steps_data
+                "completed_steps": serialize_progress_steps(completed_steps),
+                "remaining_steps": serialize_progress_steps(remaining_steps)
             }, StatusCodes.success)
 
     except Exception as e:
@@ -194,41 +491,18 @@ def get_computer_progress(computer_name: str) -> tuple:
 def get_computer_progress_by_id(computer_id: int) -> tuple:
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer: # Handle computer not existing
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
 
-            completed_steps = computer.setup_steps
-            profile = computer.profile
-
-            if not profile:
+            if computer.profile_id is None:
                 return (False, f"No profile associated with computer ID '{computer_id}'", StatusCodes.not_found)
 
-            total_steps = profile.setup_steps_to_follow
-            remaining_steps = [step for step in total_steps if step not in completed_steps]
-
-            # Serialize the steps data to prevent session binding issues
-            completed_steps_data = [
-                {
-                    "id": step.id,
-                    "name": step.name,
-                    "download_link": step.download_link
-                }
-                for step in completed_steps
-            ]
-            
-            remaining_steps_data = [
-                {
-                    "id": step.id,
-                    "name": step.name,
-                    "download_link": step.download_link
-                }
-                for step in remaining_steps
-            ]
+            completed_steps, remaining_steps = load_progress_steps(session, computer.id, computer.profile_id)
 
             return (True, {
-                "completed_steps": completed_steps_data,
-                "remaining_steps": remaining_steps_data
+                "completed_steps": serialize_progress_steps(completed_steps),
+                "remaining_steps": serialize_progress_steps(remaining_steps)
             }, StatusCodes.success)
 
     except Exception as e:
@@ -250,7 +524,7 @@ def create_computer(name: str, deadline: datetime, profile_id: int, technician_i
             
             # Check if profile exists
             from .db import Profiles
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            profile = session.get(Profiles, profile_id)
             if not profile:
                 return (False, f"Profile with ID {profile_id} not found", StatusCodes.not_found)
 
@@ -293,6 +567,129 @@ def create_computer(name: str, deadline: datetime, profile_id: int, technician_i
         print(e)
         return (False, f"Computer ({name}) creation failed", StatusCodes.internal_server_error)
 
+def expand_computer_names(pattern: str, count: int, start: int = 1) -> tuple:
+    """Expand a name pattern such as 'LAPTOP-{n:03d}' into count names numbered from start"""
+    if '{n' not in pattern:
+        return (None, "Pattern must contain a {n} placeholder")
+    if count < 1 or count > BULK_CREATE_MAX_COMPUTERS:
+        return (None, f"Count must be between 1 and {BULK_CREATE_MAX_COMPUTERS}")
+    try:
+        return ([pattern.format(n=number) for number in range(start, start + count)], None)
+    # '{n.foo}' and '{n[0]}' fail with AttributeError and TypeError, since n is an int
+    except (KeyError, IndexError, ValueError, AttributeError, TypeError) as e:
+        return (None, f"Invalid pattern: {e}")
+
+def find_existing_computer_names(session, names: list) -> set:
+    """Return the subset of names that already belong to a computer, in a few IN lookups"""
+    existing = set()
+    for offset in range(0, len(names), NAME_LOOKUP_CHUNK_SIZE):
+        chunk = names[offset:offset + NAME_LOOKUP_CHUNK_SIZE]
+        existing.update(session.scalars(select(Computers.name).where(Computers.name.in_(chunk))))
+    return existing
+
+def insert_computers(session, rows: list) -> list:
+    """Bulk insert validated computer rows with their technicians and copied preset attributes.
+
+    Each row is a dict with name, deadline, profile_id and technician_ids. The
+    preset attributes of every profile involved are read once, then the
+    computers, the technician association and the attribute copies are each
+    written with a single executemany INSERT. Returns the new computer ids in
+    row order.
+    """
+    if not rows:
+        return []
+
+    # Names are unique, so RETURNING rows are matched back by name rather than by
+    # parameter order, which SQLite could only guarantee one row at a time
+    ids_by_name = dict(session.execute(
+        insert(Computers).returning(Computers.name, Computers.id),
+        [{"name": row["name"], "deadline": row["deadline"], "profile_id": row["profile_id"]} for row in rows]
+    ).all())
+    computer_ids = [ids_by_name[row["name"]] for row in rows]
+
+    technician_links = [
+        {"computer_id": computer_id, "technician_id": technician_id}
+        for computer_id, row in zip(computer_ids, rows)
+        for technician_id in row["technician_ids"]
+    ]
+    if technician_links:
+        session.execute(insert(computer_technician_association), technician_links)
+
+    presets_by_profile = defaultdict(list)
+    for profile_id, key, value in session.execute(
+        select(ProfileAttributes.profile_id, ProfileAttributes.key, ProfileAttributes.value)
+        .where(ProfileAttributes.profile_id.in_({row["profile_id"] for row in rows}))
+    ):
+        presets_by_profile[profile_id].append((key, value))
+
+    attribute_rows = [
+        {"computer_id": computer_id, "key": key, "value": value}
+        for computer_id, row in zip(computer_ids, rows)
+        for key, value in presets_by_profile[row["profile_id"]]
+    ]
+    if attribute_rows:
+        session.execute(insert(ComputerAttributes), attribute_rows)
+
+    return computer_ids
+
+def create_computers(names: list, deadline: datetime, profile_id: int, technician_ids: list) -> tuple:
+    """Create many computers sharing a deadline, profile and technicians in one transaction.
+
+    The profile and technicians are validated once for the whole batch. Names
+    that are empty, repeated in the request or already taken are reported as
+    per-row failures and the remaining computers are still created.
+    """
+    try:
+        if not names:
+            return (False, "No computer names given", None, StatusCodes.bad_request)
+        if len(names) > BULK_CREATE_MAX_COMPUTERS:
+            return (False, f"At most {BULK_CREATE_MAX_COMPUTERS} computers can be created per request", None, StatusCodes.bad_request)
+
+        with get_db_session() as session:
+            technicians = session.query(Technicians).filter(Technicians.id.in_(technician_ids)).all()
+            if not technicians or len(technicians) != len(set(technician_ids)):
+                return (False, "Some technician IDs are invalid", None, StatusCodes.not_found)
+
+            profile = session.get(Profiles, profile_id)
+            if not profile:
+                return (False, f"Profile with ID {profile_id} not found", None, StatusCodes.not_found)
+
+            failed = []
+            seen = set()
+            candidates = []
+            for name in names:
+                name = name.strip() if isinstance(name, str) else ''
+                if not name:
+                    failed.append({"name": name, "error": "Name cannot be empty"})
+                elif name in seen:
+                    failed.append({"name": name, "error": "Duplicate name in request"})
+                else:
+                    seen.add(name)
+                    candidates.append(name)
+
+            existing = find_existing_computer_names(session, candidates)
+            failed.extend({"name": name, "error": f"Computer '{name}' already exists"} for name in candidates if name in existing)
+
+            unique_technician_ids = [tech.id for tech in technicians]
+            rows = [
+                {"name": name, "deadline": deadline, "profile_id": profile.id, "technician_ids": unique_technician_ids}
+                for name in candidates if name not in existing
+            ]
+            computer_ids = insert_computers(session, rows)
+            created = [{"id": computer_id, "name": row["name"]} for computer_id, row in zip(computer_ids, rows)]
+
+            results = {"created": created, "failed": failed}
+            message = f"Created {len(created)} computer(s) for profile '{profile.name}'"
+            if failed:
+                message += f", {len(failed)} failed"
+            if not created:
+                return (False, message, results, StatusCodes.conflict)
+            return (True, message, results, StatusCodes.success)
+
+    except Exception as e:
+        print(e)
+        return (False, "Bulk computer creation failed", None, StatusCodes.internal_server_error)
+
 def assign_technicians_to_computer(computer_name: str, technician_ids: list) -> tuple:
     """Assign multiple technicians to a computer"""
     try:
@@ -328,7 +725,7 @@ def assign_profile_to_computer(computer_name: str, profile_id: int) -> tuple:
             
             # Check if profile exists
             from .db import Profiles
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            profile = session.get(Profiles, profile_id)
             if not profile:
                 return (False, f"Profile with ID {profile_id} not found", StatusCodes.not_found)
             
@@ -409,10 +806,7 @@ def edit_computer_notes(computer_name: str, notes: str) -> tuple:
 def calculate_progress(computer):
     """Calculate progress information for a computer"""
     try:
-        completed_steps = computer.setup_steps
-        profile = computer.profile
-        
-        if not profile:
+        if computer.profile_id is None:
             return {
                 "completed_steps_num": 0,
                 "remaining_steps_num": 0,
@@ -421,8 +815,7 @@ def calculate_progress(computer):
                 "remaining_steps": []
             }
         
-        total_steps = profile.setup_steps_to_follow
-        remaining_steps = [step for step in total_steps if step not in completed_steps]
+        completed_steps, remaining_steps = load_progress_steps(object_session(computer), computer.id, computer.profile_id)
         
         return {
             "completed_steps_num": len(completed_steps),
@@ -463,7 +856,7 @@ def computer_info(computer_name: str) -> dict:
 
 def computer_info_by_id(computer_id: int) -> dict:
     with get_db_session() as session:
-        computer = session.query(Computers).filter_by(id=computer_id).first()
+        computer = session.get(Computers, computer_id)
         if not computer:
             return {"Error": f"Computer with ID '{computer_id}' not found", "code": 404}
         
@@ -579,62 +972,9 @@ def set_computer_attributes(computer_name: str, attributes: dict) -> tuple:
             if not computer:
                 return (False, f"Computer '{computer_name}' not found", StatusCodes.not_found)
             
-            # Get all existing attributes for this computer
-            existing_attrs = session.query(ComputerAttributes).filter_by(
-                computer_id=computer.id
-            ).all()
-            
-            # Create sets of keys for comparison
-            existing_keys = {attr.key for attr in existing_attrs}
-            new_keys = set(attributes.keys())
-            
-            updated_attrs = []
-            created_attrs = []
-            deleted_attrs = []
-            
-            # Update or create attributes
-            for key, value in attributes.items():
-                existing_attr = session.query(ComputerAttributes).filter_by(
-                    computer_id=computer.id, key=key
-                ).first()
-                
-                if existing_attr:
-                    # Update existing attribute
-                    existing_attr.value = value
-                    updated_attrs.append(key)
-                else:
-                    # Create new attribute
-                    new_attr = ComputerAttributes(
-                        computer_id=computer.id,
-                        key=key,
-                        value=value
-                    )
-                    session.add(new_attr)
-                    created_attrs.append(key)
-            
-            # Delete attributes that are no longer present
-            keys_to_delete = existing_keys - new_keys
-            for key in keys_to_delete:
-                attr_to_delete = session.query(ComputerAttributes).filter_by(
-                    computer_id=computer.id, key=key
-                ).first()
-                if attr_to_delete:
-                    session.delete(attr_to_delete)
-                    deleted_attrs.append(key)
-            
-            # Build message
-            message_parts = []
-            if created_attrs:
-                message_parts.append(f"Created attributes: {', '.join(created_attrs)}")
-            if updated_attrs:
-                message_parts.append(f"Updated attributes: {', '.join(updated_attrs)}")
-            if deleted_attrs:
-                message_parts.append(f"Deleted attributes: {', '.join(deleted_attrs)}")
-            
-            if message_parts:
-                message = f"Attributes set for computer '{computer_name}'. " + "; ".join(message_parts)
-            else:
-                message = f"No changes made to attributes for computer '{computer_name}'"
+            # Diff against the stored attributes and write the changes in bulk
+            created_attrs, updated_attrs, deleted_attrs = replace_attributes(session, computer, attributes)
+            message = describe_attribute_changes(f"computer '{computer_name}'", created_attrs, updated_attrs, deleted_attrs)
             
             return (True, message, StatusCodes.success)
     
@@ -647,21 +987,18 @@ def toggle_step_by_id(computer_id: int, step_name: str) -> tuple:
     try:
         with get_db_session() as session:
             # Finding computer by ID
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
-            # Finding step
-            step = session.query(SetupSteps).filter_by(name=step_name).first()
-            if not step:
+            completed = toggle_computer_step(session, computer, step_name)
+            if completed is None:
                 return (False, f"Setup step '{step_name}' not found", StatusCodes.not_found)
             
-            if step in computer.setup_steps: # Remove existing step
-                computer.setup_steps.remove(step)
-                return (True, f"Step '{step_name}' removed from computer '{computer.name}'", StatusCodes.success)
-            else: # Add existing step
-                computer.setup_steps.append(step)
+            if completed:
                 return (True, f"Marked step '{step_name}' as complete for computer '{computer.name}'", StatusCodes.success)
+            else:
+                return (True, f"Step '{step_name}' removed from computer '{computer.name}'", StatusCodes.success)
     except Exception as e:
         print(e)
         return (False, "Error changing step value", StatusCodes.internal_server_error)
@@ -670,7 +1007,7 @@ def edit_computer_name_by_id(computer_id: int, new_name: str) -> tuple:
     try:
         with get_db_session() as session:
             # Find the computer by ID
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -695,7 +1032,7 @@ def edit_computer_deadline_by_id(computer_id: int, new_deadline: datetime) -> tu
     try:
         with get_db_session() as session:
             # Find the computer by ID
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -714,7 +1051,7 @@ def edit_computer_deadline_by_id(computer_id: int, new_deadline: datetime) -> tu
 def edit_computer_notes_by_id(computer_id: int, notes: str) -> tuple:
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -730,7 +1067,7 @@ def assign_technicians_to_computer_by_id(computer_id: int, technician_ids: list)
     """Assign multiple technicians to a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -755,13 +1092,13 @@ def assign_profile_to_computer_by_id(computer_id: int, profile_id: int) -> tuple
     """Assign a profile to a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
             # Check if profile exists
             from .db import Profiles
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            profile = session.get(Profiles, profile_id)
             if not profile:
                 return (False, f"Profile with ID {profile_id} not found", StatusCodes.not_found)
             
@@ -804,10 +1141,106 @@ def assign_profile_to_computer_by_id(computer_id: int, profile_id: int) -> tuple
         print(e)
         return (False, f"Error assigning profile to computer", StatusCodes.internal_server_error)
 
+def assign_profile_to_computers(computer_ids: list, profile_id: int, chunk_size: int = REASSIGN_CHUNK_SIZE) -> tuple:
+    """Move many computers to a profile, with the same effect as assign_profile_to_computer_by_id.
+
+    The profile and its preset attributes are read once. Computers are then
+    processed chunk_size at a time, each chunk in its own transaction: one
+    UPDATE of profile_id, one DELETE of completed steps, one DELETE of
+    attributes and one executemany INSERT of the preset copies. Computers
+    already on the profile are skipped, unknown ids and chunks that fail are
+    reported in "failed" while earlier chunks stay committed.
+
+    Returns 200 when nothing failed, 207 (multi-status) when some computers
+    were reassigned or skipped and others failed, and 404 when every id is unknown.
+    """
+    try:
+        computer_ids = list(dict.fromkeys(computer_ids))
+        if not computer_ids:
+            return (False, "computer_ids cannot be empty", None, StatusCodes.bad_request)
+
+        with get_db_session() as session:
+            profile = session.get(Profiles, profile_id)
+            if not profile:
+                return (False, f"Profile with ID {profile_id} not found", None, StatusCodes.not_found)
+            profile_name = profile.name
+            presets = session.execute(
+                select(ProfileAttributes.key, ProfileAttributes.value)
+                .where(ProfileAttributes.profile_id == profile_id)
+                .order_by(ProfileAttributes.id)
+            ).all()
+    except Exception as e:
+        print(e)
+        return (False, "Error assigning profile to computers", None, StatusCodes.internal_server_error)
+
+    results = {"reassigned": [], "skipped": [], "failed": []}
+    not_found = 0
+    for offset in range(0, len(computer_ids), chunk_size):
+        chunk = computer_ids[offset:offset + chunk_size]
+        skipped, failed, targets = [], [], None
+        try:
+            with get_db_session() as session:
+                current_profiles = dict(session.execute(
+                    select(Computers.id, Computers.profile_id).where(Computers.id.in_(chunk))
+                ).all())
+                targets = []
+                for computer_id in chunk:
+                    if computer_id not in current_profiles:
+                        failed.append({"id": computer_id, "error": f"Computer with ID '{computer_id}' not found"})
+                    elif current_profiles[computer_id] == profile_id:
+                        skipped.append(computer_id)
+                    else:
+                        targets.append(computer_id)
+
+                if targets:
+                    session.execute(
+                        update(Computers).where(Computers.id.in_(targets)).values(profile_id=profile_id),
+                        execution_options={"synchronize_session": False}
+                    )
+                    # Completed steps belong to the old profile, reset them
+                    session.execute(delete(computer_step_association).where(computer_step_association.c.computer_id.in_(targets)))
+                    session.execute(
+                        delete(ComputerAttributes).where(ComputerAttributes.computer_id.in_(targets)),
+                        execution_options={"synchronize_session": False}
+                    )
+                    if presets:
+                        session.execute(insert(ComputerAttributes), [
+                            {"computer_id": computer_id, "key": key, "value": value}
+                            for computer_id in targets for key, value in presets
+                        ])
+            results["reassigned"].extend(targets)
+            not_found += len(failed)
+        except Exception as e:
+            print(e)
+            # The chunk was rolled back: its targets (or, if it failed before they were known, all of it) are unchanged
+            not_found += len(failed)
+            failed += [
+                {"id": computer_id, "error": "Error assigning profile to computer"}
+                for computer_id in (targets if targets is not None else chunk)
+            ]
+        results["skipped"].extend(skipped)
+        results["failed"].extend(failed)
+
+    message = f"{len(results['reassigned'])} computer(s) moved to profile '{profile_name}'. Setup steps have been reset."
+    if results["skipped"]:
+        message += f" {len(results['skipped'])} already had this profile."
+    if not_found:
+        message += f" {not_found} not found."
+    if len(results["failed"]) > not_found:
+        message += f" {len(results['failed']) - not_found} could not be reassigned."
+
+    if not results["failed"]:
+        return (True, message, results, StatusCodes.success)
+    if results["reassigned"] or results["skipped"]:
+        return (False, message, results, StatusCodes.multi_status)
+    if not_found == len(results["failed"]):
+        return (False, message, results, StatusCodes.not_found)
+    return (False, message, results, StatusCodes.internal_server_error)
+
 def delete_computer_by_id(computer_id: int) -> tuple:
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -827,7 +1260,7 @@ def set_computer_attribute_by_id(computer_id: int, key: str, value: str) -> tupl
     """Set a custom attribute for a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -859,7 +1292,7 @@ def get_computer_attribute_by_id(computer_id: int, key: str) -> tuple:
     """Get a specific custom attribute for a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", None, StatusCodes.not_found)
             
@@ -880,7 +1313,7 @@ def get_computer_attributes_by_id(computer_id: int) -> tuple:
     """Get all custom attributes for a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", None, StatusCodes.not_found)
             
@@ -895,7 +1328,7 @@ def delete_computer_attribute_by_id(computer_id: int, key: str) -> tuple:
     """Delete a custom attribute for a computer by ID"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
@@ -917,69 +1350,35 @@ def set_computer_attributes_by_id(computer_id: int, attributes: dict) -> tuple:
     """Set multiple custom attributes for a computer by ID (replaces all existing attributes)"""
     try:
         with get_db_session() as session:
-            computer = session.query(Computers).filter_by(id=computer_id).first()
+            computer = session.get(Computers, computer_id)
             if not computer:
                 return (False, f"Computer with ID '{computer_id}' not found", StatusCodes.not_found)
             
-            # Get all existing attributes for this computer
-            existing_attrs = session.query(ComputerAttributes).filter_by(
-                computer_id=computer.id
-            ).all()
-            
-            # Create sets of keys for comparison
-            existing_keys = {attr.key for attr in existing_attrs}
-            new_keys = set(attributes.keys())
-            
-            updated_attrs = []
-            created_attrs = []
-            deleted_attrs = []
-            
-            # Update or create attributes
-            for key, value in attributes.items():
-                existing_attr = session.query(ComputerAttributes).filter_by(
-                    computer_id=computer.id, key=key
-                ).first()
-                
-                if existing_attr:
-                    # Update existing attribute
-                    existing_attr.value = value
-                    updated_attrs.append(key)
-                else:
-                    # Create new attribute
-                    new_attr = ComputerAttributes(
-                        computer_id=computer.id,
-                        key=key,
-                        value=value
-                    )
-                    session.add(new_attr)
-                    created_attrs.append(key)
-            
-            # Delete attributes that are no longer present
-            keys_to_delete = existing_keys - new_keys
-            for key in keys_to_delete:
-                attr_to_delete = session.query(ComputerAttributes).filter_by(
-                    computer_id=computer.id, key=key
-                ).first()
-                if attr_to_delete:
-                    session.delete(attr_to_delete)
-                    deleted_attrs.append(key)
-            
-            # Build message
-            message_parts = []
-            if created_attrs:
-                message_parts.append(f"Created attributes: {', '.join(created_attrs)}")
-            if updated_attrs:
-                message_parts.append(f"Updated attributes: {', '.join(updated_attrs)}")
-            if deleted_attrs:
-                message_parts.append(f"Deleted attributes: {', '.join(deleted_attrs)}")
-            
-            if message_parts:
-                message = f"Attributes set for computer '{computer.name}'. " + "; ".join(message_parts)
-            else:
-                message = f"No changes made to attributes for computer '{computer.name}'"
+            # Diff against the stored attributes and write the changes in bulk
+            created_attrs, updated_attrs, deleted_attrs = replace_attributes(session, computer, attributes)
+            message = describe_attribute_changes(f"computer '{computer.name}'", created_attrs, updated_attrs, deleted_attrs)
             
             return (True, message, StatusCodes.success)
     
     except Exception as e:
         print(e)
         return (False, f"Error setting attributes for computer", StatusCodes.internal_server_error)
+
+def update_computer_attributes_by_id(computer_id: int, operations: list) -> tuple:
+    """Apply a batch of set/rename/delete attribute operations to a computer by ID in one transaction"""
+    try:
+        with get_db_session() as session:
+            computer = session.get(Computers, computer_id)
+            if not computer:
+                return (False, f"Computer with ID '{computer_id}' not found", None, StatusCodes.not_found)
+            
+            attributes, changes, error = apply_attribute_operations(session, computer, operations)
+            if error:
+                return (False, error, None, StatusCodes.bad_request)
+            
+            message = describe_attribute_changes(f"computer '{computer.name}'", *changes)
+            return (True, message, attributes, StatusCodes.success)
+    
+    except Exception as e:
+        print(e)
+        return (False, f"Error updating attributes for computer", None, StatusCodes.internal_server_error)
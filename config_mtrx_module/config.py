@@ -0,0 +1,80 @@
+### General imports:
+import os # Used to read settings from the environment
+import json # Used to read the optional settings file
+
+def load_config_file(path: str) -> dict:
+    """Read a JSON settings file whose keys are setting names without the CONFIG_MATRIX_ prefix"""
+    if not path:
+        return {}
+    with open(path) as config_file:
+        return json.load(config_file)
+
+# Optional JSON file, e.g. {"DATABASE_URL": "sqlite:////srv/config-matrix/computers.db", "DB_POOL_SIZE": 10}
+CONFIG_FILE = os.environ.get("CONFIG_MATRIX_CONFIG_FILE", "")
+FILE_SETTINGS = load_config_file(CONFIG_FILE)
+
+def env_setting(name: str, default, cast=str):
+    """Read setting <name> from CONFIG_MATRIX_<name>, then the settings file, falling back to default"""
+    value = os.environ.get(f"CONFIG_MATRIX_{name}")
+    if value is None or value == '':
+        value = FILE_SETTINGS.get(name)
+        if value is None:
+            return default
+    return cast(value)
+
+def env_flag(name: str, default: bool) -> bool:
+    """Read a boolean setting (1/0, true/false, yes/no, on/off)"""
+    return env_setting(name, default, lambda value: str(value).strip().lower() in ('1', 'true', 'yes', 'on'))
+
+# Database engine and connection pool, shared by the Flask app and config_mtrx_module
+DATABASE_URL = env_setting("DATABASE_URL", "sqlite:///computers.db")
+DB_ECHO = env_flag("DB_ECHO", False)
+DB_POOL_SIZE = env_setting("DB_POOL_SIZE", 5, int) # Connections kept open, size it to the worker thread count
+DB_MAX_OVERFLOW = env_setting("DB_MAX_OVERFLOW", 10, int) # Extra connections allowed during bursts
+DB_POOL_RECYCLE = env_setting("DB_POOL_RECYCLE", -1, int) # Seconds before a connection is replaced, -1 disables
+DB_POOL_PRE_PING = env_flag("DB_POOL_PRE_PING", False) # Test connections on checkout (useful for server databases)
+AUTO_INIT_DB = env_flag("AUTO_INIT_DB", True) # Create missing tables when the app starts instead of via `flask init-db`
+
+# Rows written per transaction by the CSV/JSONL computer import
+IMPORT_CHUNK_SIZE = env_setting("IMPORT_CHUNK_SIZE", 500, int)
+# Computers fetched per server-side cursor batch by the streaming export
+EXPORT_BATCH_SIZE = env_setting("EXPORT_BATCH_SIZE", 500, int)
+
+# In-process cache of logged-in technicians used by the login manager, 0 disables it.
+# Each worker process has its own cache, so changes made by another worker show up after at most the TTL (seconds)
+USER_CACHE_SIZE = env_setting("USER_CACHE_SIZE", 1024, int)
+USER_CACHE_TTL = env_setting("USER_CACHE_TTL", 300, float)
+
+# In-process cache of profile cards and technician lists, keyed by the data_versions counters of their
+# tables, so a change committed by any worker process is seen by the next lookup
+REFERENCE_CACHE_ENABLED = env_flag("REFERENCE_CACHE", True)
+REFERENCE_CACHE_SIZE = env_setting("REFERENCE_CACHE_SIZE", 256, int)
+REFERENCE_CACHE_TTL = env_setting("REFERENCE_CACHE_TTL", 60, float)
+
+# Password hashing: bcrypt work factor for new hashes, and the worker pool that runs bcrypt off the
+# request threads. Jobs beyond PASSWORD_WORKERS wait in a queue of PASSWORD_QUEUE_SIZE; when it is full,
+# or a job takes longer than PASSWORD_TIMEOUT seconds, the sign-in is refused with a "try again" error
+# Hashes below BCRYPT_ROUNDS are upgraded in the background on the next successful sign in, so the cost can be
+# raised at any time; tests can set it to 4 (the bcrypt minimum) to keep account creation fast
+BCRYPT_ROUNDS = env_setting("BCRYPT_ROUNDS", 12, int)
+# Work factor used by create_sample_db.py, low so seeding many technicians is quick; the sample
+# accounts are upgraded to BCRYPT_ROUNDS the first time they sign in
+SEED_BCRYPT_ROUNDS = env_setting("SEED_BCRYPT_ROUNDS", 4, int)
+PASSWORD_WORKERS = env_setting("PASSWORD_WORKERS", max(1, (os.cpu_count() or 2) // 2), int)
+PASSWORD_QUEUE_SIZE = env_setting("PASSWORD_QUEUE_SIZE", 32, int)
+PASSWORD_TIMEOUT = env_setting("PASSWORD_TIMEOUT", 10, float)
+
+# SQLite connection tuning, applied to every new connection when enabled:
+# - journal_mode=WAL lets readers keep working while a technician's write commits
+# - synchronous=NORMAL is durable in WAL mode and avoids an fsync per commit
+# - busy_timeout (ms) makes writers wait for the lock instead of failing with "database is locked"
+# - cache_size (negative = KiB), mmap_size (bytes) and temp_store=MEMORY cut disk reads for lookups and sorts
+SQLITE_TUNING_ENABLED = env_flag("SQLITE_TUNING", True)
+SQLITE_PRAGMAS = {
+    "journal_mode": env_setting("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": env_setting("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": env_setting("SQLITE_BUSY_TIMEOUT", 5000, int),
+    "cache_size": env_setting("SQLITE_CACHE_SIZE", -20000, int),
+    "mmap_size": env_setting("SQLITE_MMAP_SIZE", 268435456, int),
+    "temp_store": env_setting("SQLITE_TEMP_STORE", "MEMORY"),
+}
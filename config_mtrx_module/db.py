@@ -1,45 +1,100 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, ForeignKey, Table
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+from sqlalchemy import create_engine, event, inspect, text, Column, Integer, String, DateTime, ForeignKey, Table, Index
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session, relationship
+from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
+from .config import (
+    DATABASE_URL, DB_ECHO, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    SQLITE_TUNING_ENABLED, SQLITE_PRAGMAS
+)
+
+# Accepted values for the string-valued pragmas, everything else is passed as an integer
+SQLITE_PRAGMA_CHOICES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+def configure_sqlite_connection(target_engine, pragmas: dict) -> None:
+    """Register a connect hook that applies the given PRAGMA settings to every new SQLite connection"""
+    if target_engine.dialect.name != 'sqlite':
+        return
+
+    statements = []
+    for name, value in pragmas.items():
+        if name in SQLITE_PRAGMA_CHOICES:
+            value = str(value).upper()
+            if value not in SQLITE_PRAGMA_CHOICES[name]:
+                raise ValueError(f"Invalid value '{value}' for SQLite pragma '{name}'")
+        else:
+            value = int(value)
+        statements.append(f"PRAGMA {name}={value}")
+
+    @event.listens_for(target_engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+def create_db_engine(database_url: str = DATABASE_URL):
+    """Create the SQLAlchemy engine from the configured URL and pool settings"""
+    url = make_url(database_url)
+    options = {"echo": DB_ECHO, "pool_pre_ping": DB_POOL_PRE_PING, "pool_recycle": DB_POOL_RECYCLE}
 
-# Define the database URL (SQLite database stored in a file)
-DATABASE_URL = "sqlite:///computers.db"
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        # An in-memory database only exists on its connection, so every thread must share one
+        options.update(poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
 
-# Create the SQLAlchemy engine
-engine = create_engine(DATABASE_URL, echo=False)  # Set echo=False in production
+    new_engine = create_engine(url, **options)
+    if SQLITE_TUNING_ENABLED:
+        configure_sqlite_connection(new_engine, SQLITE_PRAGMAS)
+    return new_engine
+
+# Create the SQLAlchemy engine, the only one in the process
+engine = create_db_engine()
 
 # Create a base class for model definitions
 Base = declarative_base()
 
 # Association table: Profiles <-> SetupSteps
+# The composite primary key doubles as the profile -> steps lookup index
 profile_step_association = Table(
     'profile_step_association',
     Base.metadata,
-    Column('profile_id', Integer, ForeignKey('profiles.id')),
-    Column('step_id', Integer, ForeignKey('setup_steps.id'))
+    Column('profile_id', Integer, ForeignKey('profiles.id'), primary_key=True),
+    Column('step_id', Integer, ForeignKey('setup_steps.id'), primary_key=True),
+    Index('ix_profile_step_association_step_id', 'step_id')
 )
 
 # Association table: Computers <-> SetupSteps
 computer_step_association = Table(
     'computer_step_association',
     Base.metadata,
-    Column('computer_id', Integer, ForeignKey('computers.id')),
-    Column('step_id', Integer, ForeignKey('setup_steps.id'))
+    Column('computer_id', Integer, ForeignKey('computers.id'), primary_key=True),
+    Column('step_id', Integer, ForeignKey('setup_steps.id'), primary_key=True),
+    Index('ix_computer_step_association_step_id', 'step_id')
 )
 
 # Association table: Computers <-> Technicians (many-to-many)
 computer_technician_association = Table(
     'computer_technician_association',
     Base.metadata,
-    Column('computer_id', Integer, ForeignKey('computers.id')),
-    Column('technician_id', Integer, ForeignKey('technicians.id'))
+    Column('computer_id', Integer, ForeignKey('computers.id'), primary_key=True),
+    Column('technician_id', Integer, ForeignKey('technicians.id'), primary_key=True),
+    Index('ix_computer_technician_association_technician_id', 'technician_id')
 )
 
 class Technicians(Base):
     __tablename__ = 'technicians'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True, index=True)
     password = Column(String, nullable=False)
 
     # Many-to-many relationship with computers
@@ -52,6 +107,9 @@ class Technicians(Base):
 
 class ComputerAttributes(Base):
     __tablename__ = 'computer_attributes'
+    __table_args__ = (
+        Index('ix_computer_attributes_computer_id_key', 'computer_id', 'key', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     computer_id = Column(Integer, ForeignKey('computers.id'), nullable=False)
@@ -62,6 +120,9 @@ class ComputerAttributes(Base):
 
 class ProfileAttributes(Base):
     __tablename__ = 'profile_attributes'
+    __table_args__ = (
+        Index('ix_profile_attributes_profile_id_key', 'profile_id', 'key', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     profile_id = Column(Integer, ForeignKey('profiles.id'), nullable=False)
@@ -74,9 +135,9 @@ class Computers(Base):
     __tablename__ = 'computers'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String)
+    name = Column(String, unique=True, index=True)
     deadline = Column(DateTime)
-    profile_id = Column(Integer, ForeignKey('profiles.id'), nullable=True)
+    profile_id = Column(Integer, ForeignKey('profiles.id'), nullable=True, index=True)
     technician_id = Column(Integer, ForeignKey('technicians.id'), nullable=True)  # Keep for backward compatibility
     notes = Column(String, nullable=True)
 
@@ -103,7 +164,7 @@ class Profiles(Base):
     __tablename__ = 'profiles'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String)
+    name = Column(String, unique=True, index=True)
 
     setup_steps_to_follow = relationship(
         "SetupSteps", secondary=profile_step_association, back_populates="profiles"
@@ -119,7 +180,7 @@ class SetupSteps(Base):
     __tablename__ = 'setup_steps'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, unique=True, index=True)
     download_link = Column(String)  
     
     profiles = relationship(
@@ -129,23 +190,132 @@ class SetupSteps(Base):
         "Computers", secondary=computer_step_association, back_populates="setup_steps"
     )
 
-# Create the tables in the database
-Base.metadata.create_all(engine)
+class DataVersions(Base):
+    __tablename__ = 'data_versions'
+
+    # One change counter per table, bumped in the same transaction as every write to it (see versions.py)
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False)
+
+def upgrade_schema(bind=engine) -> None:
+    """Add the indexes and unique constraints of the current schema to an existing database.
+
+    create_all() only creates missing tables, so databases created before the
+    lookup indexes existed never get them. Association tables created without
+    a primary key get duplicate rows removed and a unique index on their key
+    columns instead. Unique indexes that cannot be built because of duplicate
+    values get a non-unique index in their place (see create_fallback_index),
+    so no rows are ever deleted.
+    """
+    inspector = inspect(bind)
+
+    for table in (profile_step_association, computer_step_association, computer_technician_association):
+        if not inspector.has_table(table.name) or inspector.get_pk_constraint(table.name)['constrained_columns']:
+            continue
+
+        key_columns = ', '.join(column.name for column in table.primary_key.columns)
+        with bind.begin() as connection:
+            # Duplicate link rows carry no information, keep the first of each
+            if bind.dialect.name == 'sqlite':
+                connection.execute(text(
+                    f"DELETE FROM {table.name} WHERE rowid NOT IN "
+                    f"(SELECT MIN(rowid) FROM {table.name} GROUP BY {key_columns})"
+                ))
+            connection.execute(text(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{table.name} ON {table.name} ({key_columns})"
+            ))
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with bind.begin() as connection:
+                    index.create(bind=connection, checkfirst=True)
+            except IntegrityError:
+                create_fallback_index(bind, table, index)
+                continue
+            if index.unique:
+                # Duplicates were cleaned up since an earlier start, the unique index replaces the fallback
+                with bind.begin() as connection:
+                    connection.execute(text(f"DROP INDEX IF EXISTS {index.name}_nonunique"))
+
+def create_fallback_index(bind, table, index) -> None:
+    """Index the columns of a unique index that cannot be built because of duplicate values.
+
+    Lookups on the columns stay indexed until the duplicates are cleaned up.
+    The duplicates are reported when the fallback is created, not on every start.
+    """
+    fallback_name = f"{index.name}_nonunique"
+    if fallback_name in {existing['name'] for existing in inspect(bind).get_indexes(table.name)}:
+        return
+
+    columns = ', '.join(column.name for column in index.columns)
+    with bind.begin() as connection:
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {fallback_name} ON {table.name} ({columns})"))
+        duplicates = connection.execute(text(
+            f"SELECT {columns}, COUNT(*) FROM {table.name} GROUP BY {columns} HAVING COUNT(*) > 1 LIMIT 10"
+        )).all()
+    print(f"Could not create unique index '{index.name}': duplicate values in '{table.name}' "
+          f"({', '.join(f'{row[:-1]} x{row[-1]}' for row in duplicates)}). Created non-unique index '{fallback_name}' instead")
+
+def init_db(bind=None) -> None:
+    """Create missing tables and indexes in the database. Safe to run any number of times.
+
+    Importing this module never touches the database; the app calls this once
+    at startup (see AUTO_INIT_DB), and `flask --app app init-db` runs it by hand.
+    """
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind)
+    upgrade_schema(bind)
+
+class UnitOfWorkRolledBack(Exception):
+    """Raised when a unit of work is rolled back because one of its nested blocks failed"""
 
 # Set up session to interact with the DB
 Session = sessionmaker(bind=engine)
-session = Session()
+
+# Thread-local session registry: every function running in the same thread (one
+# request under a threaded WSGI server) shares one session and its connection.
+# The Flask app calls remove_db_session() when the request ends.
+ScopedSession = scoped_session(Session)
 
 # Context manager for proper session handling
 @contextmanager
 def get_db_session():
-    """Context manager for database sessions with proper cleanup"""
-    db_session = Session()
+    """Context manager for database sessions with proper cleanup.
+
+    Works as an ambient unit of work: a get_db_session() block opened while
+    another one is active in the same thread joins it instead of starting its
+    own transaction. Only the outermost block commits or rolls back, so a
+    request can wrap several module functions in one `with get_db_session():`
+    and run them in a single transaction. If a nested block fails, the whole
+    unit of work is rolled back when the outermost block exits, and
+    UnitOfWorkRolledBack is raised there even if the failure was caught in between.
+    """
+    db_session = ScopedSession()
+    depth = db_session.info.get('unit_of_work_depth', 0)
+    db_session.info['unit_of_work_depth'] = depth + 1
     try:
         yield db_session
-        db_session.commit()
     except Exception:
-        db_session.rollback()
+        if depth == 0:
+            db_session.info.pop('rollback_only', None)
+            db_session.rollback()
+        else:
+            db_session.info['rollback_only'] = True
         raise
+    else:
+        if depth == 0:
+            if db_session.info.pop('rollback_only', False):
+                db_session.rollback()
+                raise UnitOfWorkRolledBack("A database operation failed, no changes were saved")
+            try:
+                db_session.commit()
+            except Exception:
+                db_session.rollback()
+                raise
     finally:
-        db_session.close()
+        db_session.info['unit_of_work_depth'] = depth
+
+def remove_db_session(exception=None) -> None:
+    """Close the current thread's session and return its connection to the pool"""
+    ScopedSession.remove()
@@ -0,0 +1,90 @@
+### Custom module imports:
+from .db import Computers, Profiles, get_db_session
+from .config import EXPORT_BATCH_SIZE
+from .computers import load_computer_technicians, load_computer_attributes
+from .progress import load_progress_counts
+### General imports:
+import csv
+import io
+import json
+from sqlalchemy import select
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+CSV_EXPORT_COLUMNS = [
+    'id', 'name', 'profile', 'deadline', 'technicians', 'notes',
+    'completed_steps', 'remaining_steps', 'total_steps', 'attributes'
+]
+
+def iter_export_batches(batch_size: int = EXPORT_BATCH_SIZE):
+    """Yield the fleet as lists of export records, batch_size computers at a time.
+
+    Computers are read through a server-side cursor (yield_per), and each
+    partition gets its technicians, attributes and progress counts from the
+    grouped per-batch queries, so only one batch is ever held in memory.
+    """
+    with get_db_session() as session:
+        result = session.execute(
+            select(Computers.id, Computers.name, Computers.deadline, Computers.notes, Profiles.name.label('profile_name'))
+            .outerjoin(Profiles, Profiles.id == Computers.profile_id)
+            .order_by(Computers.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for partition in result.partitions():
+            computer_ids = [computer.id for computer in partition]
+            technicians_by_computer = load_computer_technicians(session, computer_ids)
+            attributes_by_computer = load_computer_attributes(session, computer_ids)
+            progress_by_computer = load_progress_counts(session, computer_ids)
+
+            yield [
+                {
+                    'id': computer.id,
+                    'name': computer.name,
+                    'profile': computer.profile_name,
+                    'deadline': computer.deadline.strftime("%Y-%m-%d %H:%M:%S") if computer.deadline else None,
+                    'technicians': [technician['name'] for technician in technicians_by_computer.get(computer.id, [])],
+                    'notes': computer.notes or '',
+                    'completed_steps': progress_by_computer[computer.id]['completed_steps_num'],
+                    'remaining_steps': progress_by_computer[computer.id]['remaining_steps_num'],
+                    'total_steps': progress_by_computer[computer.id]['total_step_num'],
+                    'attributes': attributes_by_computer.get(computer.id, {})
+                }
+                for computer in partition
+            ]
+
+def export_computers_ndjson(batch_size: int = EXPORT_BATCH_SIZE):
+    """Generate the fleet as newline-delimited JSON, one chunk of text per batch"""
+    for batch in iter_export_batches(batch_size):
+        yield ''.join(json.dumps(record) + '\n' for record in batch)
+
+def export_computers_csv(batch_size: int = EXPORT_BATCH_SIZE):
+    """Generate the fleet as CSV, one chunk of text per batch.
+
+    technicians are joined with ';' and attributes are a JSON object, so the
+    name, deadline, profile and technicians columns can be fed back to the importer.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for batch in iter_export_batches(batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for record in batch:
+            writer.writerow(dict(
+                record,
+                profile=record['profile'] or '',
+                deadline=record['deadline'] or '',
+                technicians=';'.join(record['technicians']),
+                attributes=json.dumps(record['attributes'])
+            ))
+        yield buffer.getvalue()
+
+def export_computers(file_format: str, batch_size: int = EXPORT_BATCH_SIZE):
+    """Return the text generator for an export format"""
+    if file_format == 'csv':
+        return export_computers_csv(batch_size)
+    return export_computers_ndjson(batch_size)
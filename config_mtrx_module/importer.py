@@ -0,0 +1,178 @@
+### Custom module imports:
+from .db import Profiles, Technicians, get_db_session
+from .utils import StatusCodes
+from .config import IMPORT_CHUNK_SIZE
+from .computers import insert_computers, find_existing_computer_names
+### General imports:
+import csv
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+# Only the first row errors are kept in the report, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+DEADLINE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d")
+
+def detect_import_format(filename: str) -> str:
+    """Guess the import format from a file name, defaulting to CSV"""
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+def read_import_rows(stream, file_format: str):
+    """Yield (line number, row dict) pairs from a text stream, one row at a time.
+
+    CSV files need a header row with name, deadline, profile and technicians
+    (technician names separated by ';'). JSONL files hold one object per line
+    with the same keys, technicians may be a list. Rows that cannot be parsed
+    are yielded as (line number, error message) strings.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield (reader.line_num, row)
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield (line_number, f"Invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                yield (line_number, "Each line must be a JSON object")
+                continue
+            yield (line_number, row)
+
+def build_import_lookups(session) -> tuple:
+    """Load profile and technician name -> id maps once for the whole import"""
+    profile_ids = dict(session.execute(select(Profiles.name, Profiles.id)).all())
+    technician_ids = dict(session.execute(select(Technicians.name, Technicians.id)).all())
+    return (profile_ids, technician_ids)
+
+def parse_deadline(value: str):
+    for deadline_format in DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(value, deadline_format)
+        except ValueError:
+            continue
+    return None
+
+def parse_import_row(row: dict, profile_ids: dict, technician_ids: dict) -> tuple:
+    """Validate one import row against the lookups, returning (computer row, error message)"""
+    name = str(row.get('name') or '').strip()
+    if not name:
+        return (None, "Name cannot be empty")
+
+    deadline = parse_deadline(str(row.get('deadline') or '').strip())
+    if not deadline:
+        return (None, "Deadline must be in 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD' format")
+
+    profile_name = str(row.get('profile') or '').strip()
+    if profile_name not in profile_ids:
+        return (None, f"Profile '{profile_name}' not found")
+
+    technicians = row.get('technicians') or []
+    if isinstance(technicians, str):
+        technicians = technicians.split(';')
+    technician_names = [str(technician).strip() for technician in technicians if str(technician).strip()]
+    if not technician_names:
+        return (None, "At least one technician is required")
+    unknown = [technician for technician in technician_names if technician not in technician_ids]
+    if unknown:
+        return (None, f"Technicians not found: {', '.join(unknown)}")
+
+    return ({
+        "name": name,
+        "deadline": deadline,
+        "profile_id": profile_ids[profile_name],
+        "technician_ids": list(dict.fromkeys(technician_ids[technician] for technician in technician_names))
+    }, None)
+
+def import_computers(stream, file_format: str = 'csv', chunk_size: int = IMPORT_CHUNK_SIZE,
+                     dry_run: bool = False, progress=None) -> tuple:
+    """Stream computers from a CSV or JSONL text stream into the database.
+
+    Rows are validated one at a time and buffered up to chunk_size, then each
+    chunk is checked for taken names and written with insert_computers in its
+    own transaction. Apart from the set of names already seen, memory stays
+    bounded by the chunk size however long the file is. With dry_run nothing
+    is written. progress, if given, is called
+    with the running summary after every chunk.
+    """
+    if file_format not in IMPORT_FORMATS:
+        return (False, f"Unsupported import format '{file_format}', expected csv or jsonl", None, StatusCodes.bad_request)
+    if chunk_size < 1:
+        return (False, "Chunk size must be at least 1", None, StatusCodes.bad_request)
+
+    summary = {"processed": 0, "created": 0, "failed": 0, "errors": [], "dry_run": dry_run}
+
+    def record_error(line_number, name, error):
+        summary["failed"] += 1
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append({"line": line_number, "name": name, "error": error})
+
+    def flush_chunk(chunk):
+        try:
+            with get_db_session() as session:
+                existing = find_existing_computer_names(session, [row["name"] for _, row in chunk])
+                rows = [row for _, row in chunk if row["name"] not in existing]
+                if not dry_run:
+                    insert_computers(session, rows)
+        except IntegrityError as e:
+            # Another writer took one of the names between the check and the insert
+            print(e)
+            for line_number, row in chunk:
+                record_error(line_number, row["name"], "Chunk rolled back: a name was taken concurrently")
+        else:
+            for line_number, row in chunk:
+                if row["name"] in existing:
+                    record_error(line_number, row["name"], f"Computer '{row['name']}' already exists")
+            summary["created"] += len(rows)
+        summary["processed"] += len(chunk)
+        if progress:
+            progress(summary)
+
+    try:
+        with get_db_session() as session:
+            profile_ids, technician_ids = build_import_lookups(session)
+
+        # Names seen in earlier rows of this file, so duplicates inside the file are reported (even in dry-run)
+        seen_names = set()
+        chunk = []
+        for line_number, row in read_import_rows(stream, file_format):
+            if isinstance(row, str):
+                record_error(line_number, '', row)
+                summary["processed"] += 1
+                continue
+
+            computer, error = parse_import_row(row, profile_ids, technician_ids)
+            if not error and computer["name"] in seen_names:
+                error = "Duplicate name in file"
+            if error:
+                record_error(line_number, str(row.get('name') or ''), error)
+                summary["processed"] += 1
+                continue
+
+            seen_names.add(computer["name"])
+            chunk.append((line_number, computer))
+            if len(chunk) >= chunk_size:
+                flush_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            flush_chunk(chunk)
+
+    except (csv.Error, UnicodeDecodeError) as e:
+        print(e)
+        return (False, f"Could not read import file: {e}", summary, StatusCodes.bad_request)
+    except Exception as e:
+        print(e)
+        return (False, "Computer import failed", summary, StatusCodes.internal_server_error)
+
+    action = "Would create" if dry_run else "Created"
+    message = f"{action} {summary['created']} of {summary['processed']} computer(s)"
+    if summary["failed"]:
+        message += f", {summary['failed']} failed"
+    return (True, message, summary, StatusCodes.success)
@@ -0,0 +1,54 @@
+### General imports:
+import base64
+import json
+
+# Page size used when a list endpoint is called without a limit, and the most a client may ask for
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def clamp_page_size(limit: int | None) -> int:
+    """Apply the default and the cap to a requested page size"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return min(max(limit, 1), MAX_PAGE_SIZE)
+
+def encode_cursor(values: list) -> str:
+    """Turn the sort key values of the last row of a page into an opaque cursor string"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+def decode_cursor(cursor: str) -> list | None:
+    """Read back the values stored by encode_cursor, or None when the cursor is malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return values if isinstance(values, list) else None
+
+def decode_id_cursor(cursor: str | None) -> tuple:
+    """Read the last id stored in an id keyset cursor, returning (last id, error message)"""
+    if not cursor:
+        return (None, None)
+    values = decode_cursor(cursor)
+    if not values or len(values) != 1 or not isinstance(values[0], int):
+        return (None, "Invalid cursor")
+    return (values[0], None)
+
+def fetch_keyset_page(session, query, id_column, cursor: str | None = None, limit: int | None = None) -> tuple:
+    """Run query for one page ordered by id_column, continuing after the cursor.
+
+    Reads one row more than the page size to know whether another page
+    follows, so no COUNT or OFFSET is needed. Returns
+    (rows, page info dict with limit/next_cursor/has_more, error message).
+    """
+    limit = clamp_page_size(limit)
+    last_id, error = decode_id_cursor(cursor)
+    if error:
+        return (None, None, error)
+    if last_id is not None:
+        query = query.where(id_column > last_id)
+
+    rows = session.execute(query.order_by(id_column).limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor([rows[-1].id]) if has_more else None
+    return (rows, {"limit": limit, "next_cursor": next_cursor, "has_more": has_more}, None)
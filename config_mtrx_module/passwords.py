@@ -0,0 +1,77 @@
+### Custom module imports:
+from .config import BCRYPT_ROUNDS, PASSWORD_WORKERS, PASSWORD_QUEUE_SIZE, PASSWORD_TIMEOUT
+### General imports:
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt
+
+class PasswordPoolBusy(Exception):
+    """Raised when a password job cannot be queued or does not finish within PASSWORD_TIMEOUT"""
+
+# bcrypt releases the GIL while it works, so a small thread pool keeps hashing off the
+# request threads and caps how many CPU cores a login burst can take from API traffic
+_executor = None
+_executor_lock = threading.Lock()
+# Jobs running or waiting in the pool, new jobs are refused once it is full
+_slots = threading.BoundedSemaphore(PASSWORD_WORKERS + PASSWORD_QUEUE_SIZE)
+
+def get_executor() -> ThreadPoolExecutor:
+    """Create the password worker pool on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_WORKERS, thread_name_prefix='password')
+        return _executor
+
+def queue_password_job(function, *args):
+    """Submit a bcrypt call to the worker pool, returning its future, or None when the queue is full"""
+    if not _slots.acquire(blocking=False):
+        return None
+    try:
+        future = get_executor().submit(function, *args)
+    except Exception:
+        _slots.release()
+        raise
+    # The slot is freed when the job ends, even if the caller stopped waiting for it
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+def run_password_job(function, *args):
+    """Run a bcrypt call on the worker pool and wait for its result.
+
+    Raises PasswordPoolBusy straight away when PASSWORD_QUEUE_SIZE jobs are
+    already waiting, and when the result takes more than PASSWORD_TIMEOUT
+    seconds, so callers can answer "try again" instead of piling up.
+    """
+    future = queue_password_job(function, *args)
+    if future is None:
+        raise PasswordPoolBusy("Too many sign-in requests, please try again in a moment")
+    try:
+        return future.result(timeout=PASSWORD_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        raise PasswordPoolBusy("Password check timed out, please try again in a moment")
+
+def bcrypt_hash(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Hash a password with bcrypt on the calling thread (for scripts and jobs already on the pool)"""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
+
+def hash_rounds(stored_hash: str) -> int | None:
+    """Read the work factor of a '$2b$<rounds>$...' bcrypt hash, None if it cannot be parsed"""
+    parts = stored_hash.split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+def needs_rehash(stored_hash: str, rounds: int = BCRYPT_ROUNDS) -> bool:
+    """True when a hash was made with a lower work factor than the configured one"""
+    stored_rounds = hash_rounds(stored_hash)
+    return stored_rounds is not None and stored_rounds < rounds
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Hash a password with bcrypt at the given work factor on the worker pool"""
+    return run_password_job(bcrypt_hash, password, rounds)
+
+def check_password(password: str, stored_hash: str) -> bool:
+    """Check a password against a bcrypt hash on the worker pool"""
+    return run_password_job(bcrypt.checkpw, password.encode(), stored_hash.encode())
@@ -1,7 +1,18 @@
 ### Custom module imports:
-from .db import get_db_session, Profiles, SetupSteps, Computers, ProfileAttributes
+from .db import get_db_session, Profiles, SetupSteps, Computers, ProfileAttributes, profile_step_association
 from .utils import StatusCodes
+from .pagination import fetch_keyset_page
+from .reference import cached_reference
 from .steps import retrieve_all_steps
+from .attributes import (
+    load_attribute_rows, replace_attributes, apply_attribute_operations, describe_attribute_changes,
+    propagate_preset_changes, describe_propagation, PROPAGATION_POLICIES
+)
+from collections import defaultdict
+from sqlalchemy import select, func
+
+# Computers shown in each profile card
+PROFILE_COMPUTER_PREVIEW_SIZE = 3
 
 def add_step_to_profile(profile_name: str, step_name: str) -> tuple:
     with get_db_session() as session:
@@ -55,25 +66,143 @@ def delete_profile(name: str) -> tuple:
         print(e)
         return (False, f"Error deleting profile '{name}'", StatusCodes.internal_server_error)
     
-def retrieve_all_profiles() -> tuple:
-    try: 
+def load_profile_cards(session, cursor: str | None, limit: int | None) -> tuple:
+    """Read the reference part of a page of profile cards (names, steps, attribute counts).
+
+    Returns (cards, page info, error message) as plain data, cached by
+    retrieve_profiles until a profile or step changes.
+    """
+    profiles, page, error = fetch_keyset_page(session, select(Profiles.id, Profiles.name), Profiles.id, cursor, limit)
+    if error:
+        return (None, None, error)
+    profile_ids = [profile.id for profile in profiles]
+
+    steps_by_profile = defaultdict(list)
+    for profile_id, step_id, step_name, download_link in session.execute(
+        select(profile_step_association.c.profile_id, SetupSteps.id, SetupSteps.name, SetupSteps.download_link)
+        .join(SetupSteps, SetupSteps.id == profile_step_association.c.step_id)
+        .where(profile_step_association.c.profile_id.in_(profile_ids))
+        .order_by(profile_step_association.c.profile_id, SetupSteps.id)
+    ):
+        steps_by_profile[profile_id].append({"id": step_id, "name": step_name, "download_link": download_link})
+
+    attribute_counts = dict(session.execute(
+        select(ProfileAttributes.profile_id, func.count(ProfileAttributes.id))
+        .where(ProfileAttributes.profile_id.in_(profile_ids))
+        .group_by(ProfileAttributes.profile_id)
+    ).all())
+
+    cards = [
+        {
+            "id": profile.id,
+            "name": profile.name,
+            "steps": steps_by_profile.get(profile.id, []),
+            "attributes_count": attribute_counts.get(profile.id, 0)
+        }
+        for profile in profiles
+    ]
+    return (cards, page, None)
+
+def retrieve_profiles(cursor: str | None = None, limit: int | None = None) -> tuple:
+    """Get one page of profile cards (steps, computer preview and counts), keyset-paginated on id.
+
+    Names, steps and attribute counts come from the reference-data cache;
+    the computer counts and previews of the page change with every computer
+    write, so they are read fresh with one grouped query each.
+    """
+    try:
         with get_db_session() as session:
-            # Retrieving all profiles
-            profiles = session.query(Profiles).all()
-            
-            if profiles:
-                serialized_profiles = [
-                   {
-                       'id': profile.id,
-                       'name': profile.name,
-                   }
-                   for profile in profiles
-                ]
-                return (True, "Profiles retrieved successfully", serialized_profiles, StatusCodes.success)
-            else:
-                return (True, "No profiles have been created yet", [], StatusCodes.success)
+            cards, page, error = cached_reference(
+                ('profiles', 'steps'), ('cards', cursor, limit),
+                lambda: load_profile_cards(session, cursor, limit)
+            )
+            if error:
+                return (False, error, None, StatusCodes.bad_request)
+            profile_ids = [card["id"] for card in cards]
+
+            computer_counts = dict(session.execute(
+                select(Computers.profile_id, func.count(Computers.id))
+                .where(Computers.profile_id.in_(profile_ids))
+                .group_by(Computers.profile_id)
+            ).all())
+
+            # First few computers of every profile in one query, numbered per profile by a window function
+            numbered = (
+                select(
+                    Computers.profile_id, Computers.id, Computers.name, Computers.deadline,
+                    func.row_number().over(partition_by=Computers.profile_id, order_by=Computers.id).label('position')
+                )
+                .where(Computers.profile_id.in_(profile_ids))
+                .subquery()
+            )
+            previews_by_profile = defaultdict(list)
+            for computer in session.execute(
+                select(numbered)
+                .where(numbered.c.position <= PROFILE_COMPUTER_PREVIEW_SIZE)
+                .order_by(numbered.c.profile_id, numbered.c.id)
+            ):
+                previews_by_profile[computer.profile_id].append({
+                    "id": computer.id,
+                    "name": computer.name,
+                    "deadline": computer.deadline.isoformat() if computer.deadline else None
+                })
+
+            serialized_profiles = [
+                {
+                    "id": card["id"],
+                    "name": card["name"],
+                    "description": "",
+                    "steps": card["steps"],
+                    "step_count": len(card["steps"]),
+                    "computer_preview": previews_by_profile.get(card["id"], []),
+                    "total_computers": computer_counts.get(card["id"], 0),
+                    "attributes_count": card["attributes_count"]
+                }
+                for card in cards
+            ]
+            return (True, "Profiles retrieved successfully", {"profiles": serialized_profiles, **page}, StatusCodes.success)
     except Exception as e:
-        return (False, "An error occurred while mapping profiles", [], StatusCodes.internal_server_error)
+        print(e)
+        return (False, "An error occurred while mapping profiles", None, StatusCodes.internal_server_error)
+
+def retrieve_profile_computers(profile_id: int, cursor: str | None = None, limit: int | None = None) -> tuple:
+    """Get one page of the computers using a profile, keyset-paginated on id"""
+    try:
+        with get_db_session() as session:
+            profile = session.get(Profiles, profile_id)
+            if not profile:
+                return (False, "Profile not found", None, StatusCodes.not_found)
+
+            computers, page, error = fetch_keyset_page(
+                session,
+                select(Computers.id, Computers.name, Computers.deadline, Computers.notes).where(Computers.profile_id == profile_id),
+                Computers.id, cursor, limit
+            )
+            if error:
+                return (False, error, None, StatusCodes.bad_request)
+
+            computer_count = session.execute(
+                select(func.count(Computers.id)).where(Computers.profile_id == profile_id)
+            ).scalar_one()
+
+            return (True, f"Computers retrieved for profile '{profile.name}'", {
+                "profile_id": profile_id,
+                "profile_name": profile.name,
+                "computers": [
+                    {
+                        "id": computer.id,
+                        "name": computer.name,
+                        "deadline": computer.deadline.isoformat() if computer.deadline else None,
+                        "notes": computer.notes or ""
+                    }
+                    for computer in computers
+                ],
+                "computer_count": computer_count,
+                **page
+            }, StatusCodes.success)
+    except Exception as e:
+        print(e)
+        return (False, "Failed to retrieve profile computers", None, StatusCodes.internal_server_error)
 
 def get_profile_steps(profile_name: str) -> tuple:
     try:        
@@ -122,7 +251,7 @@ def get_available_steps_for_profile(profile_id: int) -> tuple:
     """Get all steps that are not currently assigned to a profile"""
     try:
         with get_db_session() as session:
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            profile = session.get(Profiles, profile_id)
             if not profile:
                 return (False, "Profile not found", [], StatusCodes.not_found)
             
@@ -153,8 +282,8 @@ def remove_step_from_profile_by_id(profile_id: int, step_id: int) -> tuple:
     """Remove a step from a profile by their IDs"""
     try:
         with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(id=step_id).first()
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            step = session.get(SetupSteps, step_id)
+            profile = session.get(Profiles, profile_id)
             
             if not step:
                 return (False, "Setup step not found", StatusCodes.not_found)
@@ -177,8 +306,8 @@ def add_step_to_profile_by_id(profile_id: int, step_id: int) -> tuple:
     """Add a step to a profile by their IDs"""
     try:
         with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(id=step_id).first()
-            profile = session.query(Profiles).filter_by(id=profile_id).first()
+            step = session.get(SetupSteps, step_id)
+            profile = session.get(Profiles, profile_id)
             
             if not step:
                 return (False, "Setup step not found", StatusCodes.not_found)
@@ -197,9 +326,16 @@ def add_step_to_profile_by_id(profile_id: int, step_id: int) -> tuple:
         print(e)
         return (False, f"Error adding step to profile", StatusCodes.internal_server_error)
 
-def set_profile_attribute(profile_name: str, key: str, value: str) -> tuple:
-    """Set a preset attribute for a profile"""
+def set_profile_attribute(profile_name: str, key: str, value: str, propagate: bool = False, override_policy: str = 'keep') -> tuple:
+    """Set a preset attribute for a profile.
+
+    With propagate the change is also applied to the profile's existing
+    computers, following override_policy (see propagate_preset_changes).
+    """
     try:
+        if propagate and override_policy not in PROPAGATION_POLICIES:
+            return (False, f"override_policy must be one of: {', '.join(PROPAGATION_POLICIES)}", StatusCodes.bad_request)
+
         with get_db_session() as session:
             profile = session.query(Profiles).filter_by(name=profile_name).first()
             if not profile:
@@ -214,7 +350,8 @@ def set_profile_attribute(profile_name: str, key: str, value: str) -> tuple:
                 # Update existing attribute
                 old_value = existing_attr.value
                 existing_attr.value = value
-                return (True, f"Attribute '{key}' updated for profile '{profile_name}' from '{old_value}' to '{value}'", StatusCodes.success)
+                message = f"Attribute '{key}' updated for profile '{profile_name}' from '{old_value}' to '{value}'"
+                previous = {key: old_value}
             else:
                 # Create new attribute
                 new_attr = ProfileAttributes(
@@ -223,7 +360,13 @@ def set_profile_attribute(profile_name: str, key: str, value: str) -> tuple:
                     value=value
                 )
                 session.add(new_attr)
-                return (True, f"Attribute '{key}' set to '{value}' for profile '{profile_name}'", StatusCodes.success)
+                message = f"Attribute '{key}' set to '{value}' for profile '{profile_name}'"
+                previous = {}
+            
+            if propagate:
+                counts = propagate_preset_changes(session, profile.id, previous, {key: value}, override_policy)
+                message += "." + describe_propagation(counts)
+            return (True, message, StatusCodes.success)
     
     except Exception as e:
         print(e)
@@ -287,73 +430,59 @@ def delete_profile_attribute(profile_name: str, key: str) -> tuple:
         print(e)
         return (False, f"Error deleting attribute for profile '{profile_name}'", StatusCodes.internal_server_error)
 
-def set_profile_attributes(profile_name: str, attributes: dict) -> tuple:
-    """Set multiple preset attributes for a profile (replaces all existing attributes)"""
+def set_profile_attributes(profile_name: str, attributes: dict, propagate: bool = False, override_policy: str = 'keep') -> tuple:
+    """Set multiple preset attributes for a profile (replaces all existing attributes).
+
+    With propagate the changed, added and removed keys are also applied to
+    the profile's existing computers, following override_policy.
+    """
     try:
+        if propagate and override_policy not in PROPAGATION_POLICIES:
+            return (False, f"override_policy must be one of: {', '.join(PROPAGATION_POLICIES)}", StatusCodes.bad_request)
+
         with get_db_session() as session:
             profile = session.query(Profiles).filter_by(name=profile_name).first()
             if not profile:
                 return (False, f"Profile '{profile_name}' not found", StatusCodes.not_found)
             
-            # Get all existing attributes for this profile
-            existing_attrs = session.query(ProfileAttributes).filter_by(
-                profile_id=profile.id
-            ).all()
-            
-            # Create sets of keys for comparison
-            existing_keys = {attr.key for attr in existing_attrs}
-            new_keys = set(attributes.keys())
-            
-            updated_attrs = []
-            created_attrs = []
-            deleted_attrs = []
-            
-            # Update or create attributes
-            for key, value in attributes.items():
-                existing_attr = session.query(ProfileAttributes).filter_by(
-                    profile_id=profile.id, key=key
-                ).first()
-                
-                if existing_attr:
-                    # Update existing attribute
-                    existing_attr.value = value
-                    updated_attrs.append(key)
-                else:
-                    # Create new attribute
-                    new_attr = ProfileAttributes(
-                        profile_id=profile.id,
-                        key=key,
-                        value=value
-                    )
-                    session.add(new_attr)
-                    created_attrs.append(key)
-            
-            # Delete attributes that are no longer present
-            keys_to_delete = existing_keys - new_keys
-            for key in keys_to_delete:
-                attr_to_delete = session.query(ProfileAttributes).filter_by(
-                    profile_id=profile.id, key=key
-                ).first()
-                if attr_to_delete:
-                    session.delete(attr_to_delete)
-                    deleted_attrs.append(key)
-            
-            # Build message
-            message_parts = []
-            if created_attrs:
-                message_parts.append(f"Created attributes: {', '.join(created_attrs)}")
-            if updated_attrs:
-                message_parts.append(f"Updated attributes: {', '.join(updated_attrs)}")
-            if deleted_attrs:
-                message_parts.append(f"Deleted attributes: {', '.join(deleted_attrs)}")
-            
-            if message_parts:
-                message = f"Attributes set for profile '{profile_name}'. " + "; ".join(message_parts)
-            else:
-                message = f"No changes made to attributes for profile '{profile_name}'"
+            # Diff against the stored attributes and write the changes in bulk
+            existing = load_attribute_rows(session, profile)
+            created_attrs, updated_attrs, deleted_attrs = replace_attributes(session, profile, attributes, existing)
+            message = describe_attribute_changes(f"profile '{profile_name}'", created_attrs, updated_attrs, deleted_attrs)
             
+            if propagate:
+                previous = {key: row.value for key, row in existing.items()}
+                counts = propagate_preset_changes(session, profile.id, previous, attributes, override_policy)
+                message += "." + describe_propagation(counts)
             return (True, message, StatusCodes.success)
     
     except Exception as e:
         print(e)
         return (False, f"Error setting attributes for profile '{profile_name}'", StatusCodes.internal_server_error)
+
+def update_profile_attributes(profile_name: str, operations: list, propagate: bool = False, override_policy: str = 'keep') -> tuple:
+    """Apply a batch of set/rename/delete preset attribute operations to a profile in one transaction"""
+    try:
+        if propagate and override_policy not in PROPAGATION_POLICIES:
+            return (False, f"override_policy must be one of: {', '.join(PROPAGATION_POLICIES)}", None, StatusCodes.bad_request)
+
+        with get_db_session() as session:
+            profile = session.query(Profiles).filter_by(name=profile_name).first()
+            if not profile:
+                return (False, f"Profile '{profile_name}' not found", None, StatusCodes.not_found)
+            
+            existing = load_attribute_rows(session, profile)
+            attributes, changes, error = apply_attribute_operations(session, profile, operations, existing)
+            if error:
+                return (False, error, None, StatusCodes.bad_request)
+            
+            message = describe_attribute_changes(f"profile '{profile_name}'", *changes)
+            if propagate:
+                previous = {key: row.value for key, row in existing.items()}
+                counts = propagate_preset_changes(session, profile.id, previous, attributes, override_policy)
+                message += "." + describe_propagation(counts)
+            return (True, message, attributes, StatusCodes.success)
+    
+    except Exception as e:
+        print(e)
+        return (False, f"Error updating attributes for profile '{profile_name}'", None, StatusCodes.internal_server_error)
@@ -0,0 +1,150 @@
+### Custom module imports:
+from .db import (
+    Computers, SetupSteps, Profiles, Technicians, get_db_session,
+    computer_step_association, profile_step_association, computer_technician_association
+)
+from .utils import StatusCodes
+from sqlalchemy import select, func, and_, case
+
+
+def remaining_steps_condition(computer_id_column):
+    """Join condition that keeps only profile steps without a completion row for the computer"""
+    return and_(
+        computer_step_association.c.computer_id == computer_id_column,
+        computer_step_association.c.step_id == profile_step_association.c.step_id
+    )
+
+def load_progress_steps(session, computer_id: int, profile_id: int | None) -> tuple:
+    """Get the completed and remaining steps of one computer as (id, name, download_link) rows.
+
+    Both lists only hold steps of the computer's current profile (a step done
+    before it was removed from the profile no longer counts), matching
+    computer_progress_subquery(). Completed steps come from a join of the
+    profile's steps on computer_step_association and remaining steps from a
+    single anti-join, so no ORM collections are loaded or scanned.
+    """
+    if profile_id is None:
+        return ([], [])
+
+    step_columns = (SetupSteps.id, SetupSteps.name, SetupSteps.download_link)
+    profile_steps = (
+        select(*step_columns)
+        .join(profile_step_association, profile_step_association.c.step_id == SetupSteps.id)
+        .where(profile_step_association.c.profile_id == profile_id)
+        .order_by(SetupSteps.id)
+    )
+
+    completed_steps = session.execute(
+        profile_steps.join(computer_step_association, remaining_steps_condition(computer_id))
+    ).all()
+
+    remaining_steps = session.execute(
+        profile_steps
+        .outerjoin(computer_step_association, remaining_steps_condition(computer_id))
+        .where(computer_step_association.c.step_id.is_(None))
+    ).all()
+
+    return (completed_steps, remaining_steps)
+
+def load_progress_counts(session, computer_ids: list) -> dict:
+    """Count completed and remaining steps for many computers with one grouped query.
+
+    Counts come from computer_progress_subquery(), the same query behind the
+    completion state filters and get_progress_stats(): only steps of the
+    computer's current profile count, and computers without a profile report
+    zero for everything.
+    """
+    progress = computer_progress_subquery(computer_ids)
+    progress_by_computer = {}
+    for computer_id, total, completed in session.execute(
+        select(progress.c.computer_id, progress.c.total_steps, progress.c.completed_steps)
+    ):
+        progress_by_computer[computer_id] = {
+            "completed_steps_num": completed,
+            "remaining_steps_num": total - completed,
+            "total_step_num": total
+        }
+    return progress_by_computer
+
+def computer_progress_subquery(computer_ids: list | None = None):
+    """Per-computer profile step total and completed profile step count from one GROUP BY.
+
+    profile_step_association is outer-joined to computer_step_association on
+    (computer, step), so counting the completion side gives the completed profile
+    steps and counting the profile side gives the total. computer_ids limits it
+    to those computers.
+    """
+    query = (
+        select(
+            Computers.id.label('computer_id'),
+            Computers.profile_id.label('profile_id'),
+            func.count(profile_step_association.c.step_id).label('total_steps'),
+            func.count(computer_step_association.c.step_id).label('completed_steps')
+        )
+        .outerjoin(profile_step_association, profile_step_association.c.profile_id == Computers.profile_id)
+        .outerjoin(computer_step_association, remaining_steps_condition(Computers.id))
+        .group_by(Computers.id, Computers.profile_id)
+    )
+    if computer_ids is not None:
+        query = query.where(Computers.id.in_(computer_ids))
+    return query.subquery()
+
+def completion_state_columns(progress):
+    """Aggregate columns counting completed, in-progress and not-started computers"""
+    is_completed = and_(progress.c.total_steps > 0, progress.c.completed_steps == progress.c.total_steps)
+    is_not_started = progress.c.completed_steps == 0
+    return (
+        func.count(progress.c.computer_id).label('total_computers'),
+        func.sum(case((is_completed, 1), else_=0)).label('completed'),
+        func.sum(case((is_completed, 0), (is_not_started, 0), else_=1)).label('in_progress'),
+        func.sum(case((is_not_started, 1), else_=0)).label('not_started')
+    )
+
+def serialize_completion_row(row) -> dict:
+    return {
+        "total_computers": row.total_computers,
+        "completed": row.completed or 0,
+        "in_progress": row.in_progress or 0,
+        "not_started": row.not_started or 0
+    }
+
+def get_progress_stats() -> tuple:
+    """Count completed, in-progress and not-started computers per profile and per technician.
+
+    A computer is completed when every step of its profile is done and not
+    started when none is. Each breakdown is a single grouped query, so the cost
+    does not depend on the number of computers.
+    """
+    try:
+        with get_db_session() as session:
+            progress = computer_progress_subquery()
+
+            profile_rows = session.execute(
+                select(progress.c.profile_id, Profiles.name, *completion_state_columns(progress))
+                .outerjoin(Profiles, Profiles.id == progress.c.profile_id)
+                .group_by(progress.c.profile_id, Profiles.name)
+                .order_by(progress.c.profile_id)
+            ).all()
+
+            technician_rows = session.execute(
+                select(Technicians.id, Technicians.name, *completion_state_columns(progress))
+                .join(computer_technician_association, computer_technician_association.c.computer_id == progress.c.computer_id)
+                .join(Technicians, Technicians.id == computer_technician_association.c.technician_id)
+                .group_by(Technicians.id, Technicians.name)
+                .order_by(Technicians.id)
+            ).all()
+
+            stats = {
+                "profiles": [
+                    {"id": row.profile_id, "name": row.name if row.profile_id is not None else "No profile", **serialize_completion_row(row)}
+                    for row in profile_rows
+                ],
+                "technicians": [
+                    {"id": row.id, "name": row.name, **serialize_completion_row(row)}
+                    for row in technician_rows
+                ]
+            }
+            return (True, "Progress statistics retrieved successfully", stats, StatusCodes.success)
+    except Exception as e:
+        print(e)
+        return (False, "An error occurred while calculating progress statistics", None, StatusCodes.internal_server_error)
@@ -0,0 +1,43 @@
+### Custom module imports:
+from .db import get_db_session
+from .cache import TTLCache
+from .versions import get_data_versions
+from .config import REFERENCE_CACHE_ENABLED, REFERENCE_CACHE_SIZE, REFERENCE_CACHE_TTL
+
+# Tables behind each kind of rarely changing data cached in-process
+REFERENCE_TABLES = {
+    'profiles': ('profiles', 'profile_step_association', 'profile_attributes'),
+    'steps': ('setup_steps',),
+    'technicians': ('technicians',),
+}
+
+# Cached values are keyed by the change counters (see versions.py) of the tables they were
+# built from. Every write bumps those counters in its own transaction, so a change committed
+# by any worker process makes older entries unreachable; they then age out of the LRU
+reference_cache = TTLCache(REFERENCE_CACHE_SIZE if REFERENCE_CACHE_ENABLED else 0, REFERENCE_CACHE_TTL)
+
+def reference_tables(kinds: tuple) -> tuple:
+    """Tables behind the given kinds, in a stable order"""
+    return tuple(sorted({table for kind in kinds for table in REFERENCE_TABLES[kind]}))
+
+def cached_reference(kinds: tuple, key, loader):
+    """Return loader(), cached under key and the current change counters of the kinds' tables.
+
+    loader must return plain data built only from the given kinds. The cached
+    value is shared between requests and must not be modified by callers.
+    """
+    tables = reference_tables(kinds)
+    with get_db_session() as session:
+        # Reading the counters autoflushes, so pending writes of this unit of work are recorded first
+        versions = get_data_versions(session, tables)
+        # Counters are only bumped at commit, data written by the current transaction is read directly
+        if session.info.get('changed_tables', set()).intersection(tables):
+            return loader()
+
+        cache_key = (tables, versions, key)
+        found, value = reference_cache.get(cache_key)
+        if found:
+            return value
+        value = loader()
+        reference_cache.set(cache_key, value)
+        return value
@@ -64,7 +64,7 @@ def edit_step(step_id: int, name: str | None = None, download_link: str | None =
     """Edit a step's name and/or download link"""
     try:
         with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(id=step_id).first()
+            step = session.get(SetupSteps, step_id)
             if not step:
                 return (False, f"Setup step with ID {step_id} not found", StatusCodes.not_found)
             
@@ -87,7 +87,7 @@ def get_step_usage_count(step_id: int) -> tuple:
     """Get the number of profiles using this step"""
     try:
         with get_db_session() as session:
-            step = session.query(SetupSteps).filter_by(id=step_id).first()
+            step = session.get(SetupSteps, step_id)
             if not step:
                 return (False, f"Setup step with ID {step_id} not found", 0, StatusCodes.not_found)
             
@@ -1,55 +1,185 @@
-from .db import get_db_session, session, Technicians
-import bcrypt
+from .db import get_db_session, remove_db_session, Technicians, Session
+from .pagination import fetch_keyset_page
+from .cache import TTLCache
+from .reference import cached_reference
+from .config import USER_CACHE_SIZE, USER_CACHE_TTL
+from .passwords import (
+    hash_password, check_password, bcrypt_hash, needs_rehash, queue_password_job, PasswordPoolBusy
+)
+from sqlalchemy import select, update, event, inspect
+from sqlalchemy.exc import IntegrityError
+from itertools import chain
+
+# id -> (id, name) of technicians, read by the login manager on every authenticated request
+technician_cache = TTLCache(USER_CACHE_SIZE, USER_CACHE_TTL)
+
+def drop_cached_technicians(technician_ids) -> None:
+    """Drop the given technician ids from technician_cache, or every entry when technician_ids is None"""
+    if technician_ids is None:
+        technician_cache.clear()
+    else:
+        technician_cache.invalidate(*technician_ids)
+
+def record_technician_changes(session, technician_ids) -> None:
+    """Drop changed technicians now and remember them until the session's transaction ends.
+
+    A request reading a technician between the write and the commit still
+    gets the old row from the database and may cache it, so the same ids are
+    dropped again after the commit (or rollback). None stands for every technician.
+    """
+    drop_cached_technicians(technician_ids)
+    pending = session.info.get('technician_changes', set())
+    if pending is None or technician_ids is None:
+        session.info['technician_changes'] = None
+    else:
+        session.info['technician_changes'] = pending | set(technician_ids)
+
+@event.listens_for(Session, "after_flush")
+def invalidate_flushed_technicians(session, flush_context):
+    """Drop cached technicians created, changed or deleted by a flush.
+
+    New ids are dropped too, since SQLite can reuse the id of a deleted row.
+    """
+    technician_ids = [
+        instance.id
+        for instance in chain(session.new, session.dirty, session.deleted)
+        if isinstance(instance, Technicians)
+    ]
+    if technician_ids:
+        record_technician_changes(session, technician_ids)
+
+@event.listens_for(Session, "do_orm_execute")
+def invalidate_bulk_technician_changes(orm_execute_state):
+    """Bulk UPDATE/DELETE statements on technicians do not say which rows they touch, drop everything"""
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is inspect(Technicians):
+        record_technician_changes(orm_execute_state.session, None)
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def invalidate_committed_technicians(session):
+    if 'technician_changes' in session.info:
+        drop_cached_technicians(session.info.pop('technician_changes'))
+
+def load_technician(technician_id: int) -> tuple | None:
+    """Return (id, name) of a technician, or None if it does not exist, served from technician_cache when possible"""
+    found, technician = technician_cache.get(technician_id)
+    if found:
+        return technician
+
+    generation = technician_cache.generation
+    with get_db_session() as session:
+        row = session.execute(
+            select(Technicians.id, Technicians.name).where(Technicians.id == technician_id)
+        ).first()
+    if not row:
+        return None
+    technician = (row.id, row.name)
+    technician_cache.set(technician_id, technician, generation)
+    return technician
 
 # Create technician
 def create_technician(name: str, password: str) -> tuple:
     try:
         with get_db_session() as session:
-            existing = session.query(Technicians).filter_by(name=name).first()
+            existing = session.execute(select(Technicians.id).where(Technicians.name == name)).first()
             if existing:
                 return (False, f"User '{name}' already exists", 409)
 
-            # Encrypting user password
-            bytes_pass = password.encode()
-            salt = bcrypt.gensalt()
-            hashed_password = bcrypt.hashpw(bytes_pass, salt)
+        # Encrypting user password on the worker pool, without holding a database connection
+        hashed_password = hash_password(password)
 
+        with get_db_session() as session:
             # Creating technician
             new_technician = Technicians(
                 name = name,
-                password = hashed_password.decode()
+                password = hashed_password
             )
             
             # Adding user to db
             session.add(new_technician)
             return (True, f"User '{name}' was created", 200)
-    
+
+    except PasswordPoolBusy as e:
+        print(e)
+        return (False, str(e), 503)
+    except IntegrityError as e:
+        # Registered by a concurrent request while the password was being hashed
+        print(e)
+        return (False, f"User '{name}' already exists", 409)
     except Exception as e:
         print(f"\033[31m{e}\033[0m")
         return (False, f"User '{name}' creation failed", 500)
 
+# Sign in checker that also returns the technician, so the login needs a single lookup
+def authenticate_technician(name: str, password: str) -> tuple:
+    with get_db_session() as session:
+        user = session.execute(
+            select(Technicians.id, Technicians.name, Technicians.password).where(Technicians.name == name)
+        ).first()
+    if not user:
+        return (False, f"User '{name}' does not exist", None, 404)
+
+    # The password check runs on the worker pool after the session is released
+    try:
+        valid = check_password(password, user.password)
+    except PasswordPoolBusy as e:
+        print(e)
+        return (False, str(e), None, 503)
+
+    if valid:
+        if needs_rehash(user.password):
+            # Upgraded in the background, if the pool is full it is retried on the next sign in
+            queue_password_job(rehash_technician_password, user.id, password, user.password)
+        return (True, "Sign in successful", {"id": user.id, "name": user.name}, 200)
+    else:
+        return (False, "Invalid password", None, 401)
+
+# Upgrade a password hash made with a lower work factor, runs on the password worker pool
+def rehash_technician_password(technician_id: int, password: str, old_hash: str) -> None:
+    try:
+        new_hash = bcrypt_hash(password)
+        with get_db_session() as session:
+            # Only replace the hash that was checked, a password changed in the meantime wins.
+            # Core table update: the password is not in the login cache, so there is nothing to invalidate,
+            # and no list shows it, so the technicians ETag is left alone
+            table = Technicians.__table__
+            session.execute(
+                update(table)
+                .where(table.c.id == technician_id, table.c.password == old_hash)
+                .values(password=new_hash)
+                .execution_options(skip_data_versions=True)
+            )
+    except Exception as e:
+        print(e)
+    finally:
+        # The worker thread keeps no session between jobs
+        remove_db_session()
+
 # Check if user is valid (sign in checker)
 def verify_user(name: str, password: str) -> tuple:
+    success, message, _, status_code = authenticate_technician(name, password)
+    return (success, message, status_code)
+
+def load_technician_page(cursor: str | None, limit: int | None) -> tuple:
+    """Read a page of technicians as (technicians, page info, error message), cached by retrieve_technicians"""
     with get_db_session() as session:
-        user = session.query(Technicians).filter_by(name=name).first()
-        if not user:
-            return (False, f"User '{name}' does not exist", 404)
-        stored_hash = user.password.encode()
-        bytes_pass = password.encode()
-        
-        if bcrypt.checkpw(bytes_pass, stored_hash):
-            return (True, "Sign in successful", 200)
-        else:
-            return (False, "Invalid password", 401)
+        rows, page, error = fetch_keyset_page(session, select(Technicians.id, Technicians.name), Technicians.id, cursor, limit)
+        if error:
+            return (None, None, error)
+        return ([{"id": technician.id, "name": technician.name} for technician in rows], page, None)
 
-# Retrieve all technicians from the database
-def retrieve_all_technicians() -> tuple:
+# Retrieve a page of technicians, served from the reference-data cache
+def retrieve_technicians(cursor: str | None = None, limit: int | None = None) -> tuple:
     try:
-        technicians = session.query(Technicians).all()
+        technicians, page, error = cached_reference(
+            ('technicians',), ('page', cursor, limit), lambda: load_technician_page(cursor, limit)
+        )
+        if error:
+            return (False, error, None, 400)
         if technicians:
-            return (True, "Technicians retrieved successfully", technicians, 200)
+            return (True, "Technicians retrieved successfully", {"technicians": technicians, **page}, 200)
         else:
-            return (True, "No technicians have been created yet", technicians, 200)
+            return (True, "No technicians have been created yet", {"technicians": technicians, **page}, 200)
     except Exception as e:
         print(e)
-        return (False, "An error occurred while retrieving technicians", [], 500)
+        return (False, "An error occurred while retrieving technicians", None, 500)
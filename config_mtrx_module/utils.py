@@ -6,6 +6,7 @@ class StatusCodes:
     success = 200
     created = 201
     accepted = 202
+    multi_status = 207
     no_content = 204
 
     bad_request = 400
@@ -0,0 +1,111 @@
+### Custom module imports:
+from .db import Session, DataVersions
+### General imports:
+import time
+from sqlalchemy import select, insert, update, event, inspect
+
+# Tables read by each list endpoint that answers with an ETag; the tag changes whenever one of them does
+COMPUTER_LIST_TABLES = (
+    'computers', 'profiles', 'technicians', 'setup_steps',
+    'computer_technician_association', 'computer_step_association', 'profile_step_association'
+)
+ALL_COMPUTERS_TABLES = (
+    'computers', 'technicians', 'computer_technician_association', 'computer_step_association', 'computer_attributes'
+)
+PROFILE_LIST_TABLES = ('profiles', 'setup_steps', 'profile_step_association', 'profile_attributes', 'computers')
+TECHNICIAN_LIST_TABLES = ('technicians',)
+# Only these tables get change counters (the reference-data cache keys on a subset of them)
+VERSIONED_TABLES = frozenset(COMPUTER_LIST_TABLES + ALL_COMPUTERS_TABLES + PROFILE_LIST_TABLES + TECHNICIAN_LIST_TABLES)
+# Columns no list shows, changing only these does not bump the table's counter
+IGNORED_COLUMNS = {'technicians': {'password'}}
+
+def record_changed_tables(session, tables) -> None:
+    session.info.setdefault('changed_tables', set()).update(
+        table for table in tables if table in VERSIONED_TABLES
+    )
+
+def has_listed_changes(session, instance) -> bool:
+    """True when a flushed instance changed a column of its own table other than IGNORED_COLUMNS"""
+    state = inspect(instance)
+    ignored = IGNORED_COLUMNS.get(state.mapper.local_table.name)
+    if not ignored:
+        return session.is_modified(instance, include_collections=False)
+    return any(
+        state.attrs[attribute.key].history.has_changes()
+        for attribute in state.mapper.column_attrs
+        if attribute.key not in ignored
+    )
+
+def changed_tables_of(instance, own_table: bool = True, deleted: bool = False) -> set:
+    """Tables written when an instance is flushed, including the link tables of its changed collections"""
+    state = inspect(instance)
+    tables = {state.mapper.local_table.name} if own_table else set()
+    for relationship in state.mapper.relationships:
+        if relationship.secondary is None:
+            continue
+        # Deleting an object also removes its link rows
+        if deleted or state.attrs[relationship.key].history.has_changes():
+            tables.add(relationship.secondary.name)
+    return tables
+
+@event.listens_for(Session, "after_flush")
+def record_flushed_tables(session, flush_context):
+    tables = set()
+    for instance in session.new:
+        tables |= changed_tables_of(instance)
+    for instance in session.dirty:
+        # A change limited to many-to-many collections only writes the link table
+        tables |= changed_tables_of(instance, own_table=has_listed_changes(session, instance))
+    for instance in session.deleted:
+        tables |= changed_tables_of(instance, deleted=True)
+    record_changed_tables(session, tables)
+
+@event.listens_for(Session, "do_orm_execute")
+def record_statement_tables(orm_execute_state):
+    """Bulk INSERT/UPDATE/DELETE statements run through session.execute() bypass the flush.
+
+    Statements that only write IGNORED_COLUMNS opt out with execution_options(skip_data_versions=True).
+    """
+    if orm_execute_state.execution_options.get('skip_data_versions'):
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is not None and getattr(table, 'name', None):
+            record_changed_tables(orm_execute_state.session, [table.name])
+
+def bump_data_versions(session, tables) -> None:
+    """Increment the change counters of the given tables inside the current transaction"""
+    table_names = sorted(tables)
+    updated = session.execute(
+        update(DataVersions)
+        .where(DataVersions.table_name.in_(table_names))
+        .values(version=DataVersions.version + 1),
+        execution_options={"synchronize_session": False}
+    ).rowcount
+    if updated < len(table_names):
+        existing = set(session.scalars(select(DataVersions.table_name).where(DataVersions.table_name.in_(table_names))))
+        # Counters start at the current time in ms, so a recreated database never repeats an older database's tags
+        start = int(time.time() * 1000)
+        session.execute(insert(DataVersions), [
+            {"table_name": name, "version": start} for name in table_names if name not in existing
+        ])
+
+@event.listens_for(Session, "before_commit")
+def bump_changed_tables(session):
+    """Bump the counters of every table written by the transaction, atomically with the writes"""
+    # Commit flushes after this hook runs, flush now so pending objects are recorded too
+    session.flush()
+    tables = session.info.pop('changed_tables', None)
+    if tables:
+        bump_data_versions(session, tables)
+
+@event.listens_for(Session, "after_rollback")
+def forget_changed_tables(session):
+    session.info.pop('changed_tables', None)
+
+def get_data_versions(session, tables: tuple) -> tuple:
+    """Current change counters of the given tables (0 for a table never written)"""
+    versions = dict(session.execute(
+        select(DataVersions.table_name, DataVersions.version).where(DataVersions.table_name.in_(tables))
+    ).all())
+    return tuple(versions.get(table, 0) for table in tables)
@@ -1,13 +1,14 @@
-from config_mtrx_module.db import session, Technicians, Computers, Profiles, SetupSteps
+from config_mtrx_module.db import ScopedSession, Technicians, Computers, Profiles, SetupSteps, init_db
+from config_mtrx_module.config import SEED_BCRYPT_ROUNDS
+from config_mtrx_module.passwords import bcrypt_hash
 from datetime import datetime, timedelta
-import bcrypt
+
+# The script runs in a single thread, so every step shares this thread's session
+session = ScopedSession()
 
 def hash_password(password):
-    """Hash a password using bcrypt"""
-    bytes_pass = password.encode()
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(bytes_pass, salt)
-    return hashed_password.decode()
+    """Hash a password using bcrypt at the low seeding cost (SEED_BCRYPT_ROUNDS)"""
+    return bcrypt_hash(password, SEED_BCRYPT_ROUNDS)
 
 def clear_database():
     """Clear all existing data from the database"""
@@ -421,6 +422,9 @@ def print_database_summary():
 if __name__ == "__main__":
     print("Creating sample database...")
     
+    # Make sure the tables exist
+    init_db()
+    
     # Clear existing data
     clear_database()
     
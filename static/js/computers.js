@@ -2,12 +2,15 @@ document.addEventListener('DOMContentLoaded', function() {
     const container = document.getElementById('computer-cards');
     const loadingSpinner = document.getElementById('loading-spinner');
     const noComputersMessage = document.getElementById('no-computers-message');
+    const loadMoreButton = document.getElementById('load-more-computers');
     const technicianFilter = document.getElementById('technicianFilter');
     const computerSearch = document.getElementById('computerSearch');
-    let isLoading = false; // Flag to prevent multiple requests
-    let allComputers = []; // Store all computer data for filtering
-    let currentFilterId = 0; // Track current filter operation to avoid race conditions
     let selectedFilterTechnicianIds = []; // Store selected technician IDs for filtering
+    let nextCursor = null; // Cursor of the next page of the current listing
+    let requestCounter = 0; // Lets a newer listing request discard responses to older ones
+    let searchTimer = null;
+    const PAGE_SIZE = 60; // Computers requested per page
+    const SEARCH_DELAY_MS = 250; // Wait for typing to pause before querying
     
     // Use global showToast function (defined in main.js)
     // If global function is not available, use a fallback
@@ -16,43 +19,83 @@ document.addEventListener('DOMContentLoaded', function() {
         alert(message);
     };
 
-    function loadComputers() {
-        if (isLoading) {
-            console.log('loadComputers() called while already loading, skipping...');
-            return; // Exit if a request is already in progress
+    // Build the /api/computers/summary query from the filter controls; returns null when nothing can match
+    function buildComputersQuery() {
+        const showCompleted = document.getElementById('showCompleted').checked;
+        const showIncomplete = document.getElementById('showIncomplete').checked;
+        if (!showCompleted && !showIncomplete) {
+            return null;
         }
-        
-        isLoading = true;
-        loadingSpinner.style.display = 'block';
-        
-        // Clear the container immediately to prevent duplicates
-        container.innerHTML = '';
-        
-        // Increment filter ID to invalidate any pending filter operations
-        currentFilterId++;
 
-        fetch('/api/computers')
+        const params = new URLSearchParams({ limit: PAGE_SIZE });
+        const searchTerm = computerSearch.value.trim();
+        if (searchTerm) {
+            params.set('q', searchTerm);
+        }
+        if (showCompleted !== showIncomplete) {
+            params.set('state', showCompleted ? 'completed' : 'incomplete');
+        }
+        selectedFilterTechnicianIds.forEach(id => params.append('technician_id', id));
+        return params;
+    }
+
+    // Load the first page for the current filters, or the next page when append is true
+    function loadComputers(append = false) {
+        const params = buildComputersQuery();
+        const requestId = ++requestCounter;
+
+        if (!append) {
+            container.innerHTML = '';
+            nextCursor = null;
+        }
+        noComputersMessage.style.display = 'none';
+        loadMoreButton.style.display = 'none';
+
+        if (!params) {
+            noComputersMessage.style.display = 'block';
+            return;
+        }
+        if (append && nextCursor) {
+            params.set('cursor', nextCursor);
+        }
+
+        loadingSpinner.style.display = 'block';
+        fetch(`/api/computers/summary?${params.toString()}`)
             .then(response => response.json())
-            .then(computers => {
-                allComputers = computers;
-                filterComputers();
-                populateTechnicians();
+            .then(page => {
+                if (requestId !== requestCounter) {
+                    return; // A newer request replaced this one
+                }
+                if (page.Error) {
+                    throw new Error(page.Error);
+                }
+                renderComputerCards(page.computers);
+                nextCursor = page.next_cursor;
+                loadMoreButton.style.display = nextCursor ? 'inline-block' : 'none';
+                if (!container.children.length) {
+                    noComputersMessage.style.display = 'block';
+                }
             })
             .catch((error) => {
                 console.error('Error loading computers:', error);
                 showToast('Error loading computers', 'error');
             })
             .finally(() => {
-                isLoading = false;
-                loadingSpinner.style.display = 'none';
+                if (requestId === requestCounter) {
+                    loadingSpinner.style.display = 'none';
+                }
             });
     }
 
-    computerSearch.addEventListener('input', filterComputers);
+    computerSearch.addEventListener('input', function() {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => loadComputers(), SEARCH_DELAY_MS);
+    });
+    loadMoreButton.addEventListener('click', () => loadComputers(true));
     
     // Add event listeners for completion status filters
-    document.getElementById('showCompleted').addEventListener('change', filterComputers);
-    document.getElementById('showIncomplete').addEventListener('change', filterComputers);
+    document.getElementById('showCompleted').addEventListener('change', () => loadComputers());
+    document.getElementById('showIncomplete').addEventListener('change', () => loadComputers());
 
     // Function to get deadline styling based on time remaining
     function getDeadlineStyle(deadlineStr) {
@@ -99,170 +142,79 @@ document.addEventListener('DOMContentLoaded', function() {
         return { text, class: colorClass, style };
     }
 
-    function filterComputers() {
-        const searchTerm = computerSearch.value.toLowerCase().trim();
-        const showCompleted = document.getElementById('showCompleted').checked;
-        const showIncomplete = document.getElementById('showIncomplete').checked;
-        
-        // Increment filter ID to track this specific filter operation
-        const filterId = ++currentFilterId;
-        
-        // Clear container and reset state
-        container.innerHTML = '';
-        noComputersMessage.style.display = 'none';
-        
-        // If both completion status filters are disabled, show no computers message
-        if (!showCompleted && !showIncomplete) {
-            noComputersMessage.style.display = 'block';
-            return;
-        }
-        
-        const filteredComputers = allComputers.filter(computer => {
-            // Filter by technicians - if no technicians selected, show all
-            let technicianMatch = true;
-            if (selectedFilterTechnicianIds.length > 0) {
-                // Check if computer has any of the selected technicians
-                technicianMatch = selectedFilterTechnicianIds.some(selectedId => {
-                    // Check both the old single technician_id and new multiple technicians
-                    if (computer.technician_id === selectedId) {
-                        return true;
-                    }
-                    // Check if computer has technicians array (new multi-technician support)
-                    if (computer.technicians && Array.isArray(computer.technicians)) {
-                        return computer.technicians.some(tech => tech.id === selectedId);
-                    }
-                    return false;
-                });
-            }
+    // Append cards for a page of computers; rows already carry progress counts
+    function renderComputerCards(computers) {
+        const fragment = document.createDocumentFragment();
+
+        computers.forEach(computerData => {
+            let completed = parseInt(computerData.completed_steps_num) || 0;
+            let total = parseInt(computerData.total_step_num) || 0;
+            let progressPercentage = total > 0 ? Math.round((completed / total) * 100) : 0;
             
-            // Filter by name search - using startsWith instead of includes
-            const nameMatch = !searchTerm || computer.name.toLowerCase().startsWith(searchTerm);
+            // Get deadline styling
+            const deadlineStyle = getDeadlineStyle(computerData.deadline);
             
-            return technicianMatch && nameMatch;
-        });
-        
-        // If no computers to display, return early
-        if (filteredComputers.length === 0) {
-            noComputersMessage.style.display = 'block';
-            return;
-        }
-
-        // Track how many computers actually get displayed after all filters
-        let displayedCount = 0;
-        let processedCount = 0;
-        const totalToProcess = filteredComputers.length;
-        
-        // Function to check if we should show the no computers message
-        function checkNoComputersMessage() {
-            if (processedCount === totalToProcess && displayedCount === 0) {
-                noComputersMessage.style.display = 'block';
-            }
-        }
-
-        filteredComputers.forEach((computer, index) => {
-            setTimeout(() => {
-                fetch(`/api/computer_info/${computer.id}`)
-                    .then(response => response.json())
-                    .then(computerData => {
-                    processedCount++;
-                    
-                    // Only add card if this is still the current filter operation
-                    if (!computerData.Error && filterId === currentFilterId) {
-                        const card = document.createElement('div');
-                        card.className = 'col-lg-4 col-md-6 col-sm-12 mb-4';
-                        let completed = parseInt(computerData.completed_steps_num) || 0;
-                        let total = parseInt(computerData.total_step_num) || 0;
-                        let progressPercentage = total > 0 ? Math.round((completed / total) * 100) : 0;
-                        
-                        // Check completion status filter
-                        const isCompleted = progressPercentage === 100;
-                        const showCompleted = document.getElementById('showCompleted').checked;
-                        const showIncomplete = document.getElementById('showIncomplete').checked;
-                        
-                        // Skip this computer if it doesn't match the completion status filter
-                        if ((isCompleted && !showCompleted) || (!isCompleted && !showIncomplete)) {
-                            checkNoComputersMessage();
-                            return;
-                        }
-                        
-                        displayedCount++;
-                        
-                        // Get deadline styling
-                        const deadlineStyle = getDeadlineStyle(computerData.deadline);
-                        
-                        card.innerHTML = `
-                            <div class="card h-100">
-                                <div class="card-header">
-                                    <h5 class="card-title mb-0">${computerData.name}</h5>
-                                </div>
-                                <div class="card-body d-flex flex-column">
-                                    <p class="mb-2"><strong>Profile:</strong> ${computerData.profile ? computerData.profile.name : 'No profile'}</p>
-                                    <p class="mb-2"><strong>Technician${computerData.technicians && computerData.technicians.length > 1 ? 's' : ''}:</strong> ${computerData.technicians && computerData.technicians.length > 0 ? computerData.technicians.map(tech => tech.name).join(', ') : 'Unassigned'}</p>
-                                    <p class="mb-2"><strong>Deadline:</strong> <span class="${deadlineStyle.class}" style="${deadlineStyle.style}">${deadlineStyle.text}</span></p>
-                                    <p class="mb-3"><strong>Steps:</strong> ${completed}/${total} completed</p>
-                                    <div class="progress-section mb-3">
-                                        <div class="d-flex justify-content-between align-items-center mb-2">
-                                            <span class="progress-label">Setup Progress</span>
-                                            <span class="progress-percentage">${progressPercentage}%</span>
-                                        </div>
-                                        <div class="custom-progress-bar">
-                                            <div class="progress-fill" style="width: ${progressPercentage}%"></div>
-                                        </div>
-                                    </div>
-                                    <div class="mt-auto">
-                                        <a href="/setup/${computerData.id}" class="btn btn-primary w-100">
-                                            <i class="bi bi-arrow-right"></i> Continue Setup
-                                        </a>
-                                    </div>
-                                </div>
+            const card = document.createElement('div');
+            card.className = 'col-lg-4 col-md-6 col-sm-12 mb-4';
+            card.innerHTML = `
+                <div class="card h-100">
+                    <div class="card-header">
+                        <h5 class="card-title mb-0">${computerData.name}</h5>
+                    </div>
+                    <div class="card-body d-flex flex-column">
+                        <p class="mb-2"><strong>Profile:</strong> ${computerData.profile ? computerData.profile.name : 'No profile'}</p>
+                        <p class="mb-2"><strong>Technician${computerData.technicians && computerData.technicians.length > 1 ? 's' : ''}:</strong> ${computerData.technicians && computerData.technicians.length > 0 ? computerData.technicians.map(tech => tech.name).join(', ') : 'Unassigned'}</p>
+                        <p class="mb-2"><strong>Deadline:</strong> <span class="${deadlineStyle.class}" style="${deadlineStyle.style}">${deadlineStyle.text}</span></p>
+                        <p class="mb-3"><strong>Steps:</strong> ${completed}/${total} completed</p>
+                        <div class="progress-section mb-3">
+                            <div class="d-flex justify-content-between align-items-center mb-2">
+                                <span class="progress-label">Setup Progress</span>
+                                <span class="progress-percentage">${progressPercentage}%</span>
                             </div>
-                        `;
-                        container.appendChild(card);
-                    } else {
-                        // Computer data has error or filter ID changed
-                        checkNoComputersMessage();
-                    }
-                })
-                .catch(error => {
-                    console.error('Error fetching computer info:', error);
-                    processedCount++;
-                    checkNoComputersMessage();
-                });
-            }, index * 50); // 50ms delay between each request
+                            <div class="custom-progress-bar">
+                                <div class="progress-fill" style="width: ${progressPercentage}%"></div>
+                            </div>
+                        </div>
+                        <div class="mt-auto">
+                            <a href="/setup/${computerData.id}" class="btn btn-primary w-100">
+                                <i class="bi bi-arrow-right"></i> Continue Setup
+                            </a>
+                        </div>
+                    </div>
+                </div>
+            `;
+            fragment.appendChild(card);
         });
+
+        container.appendChild(fragment);
     }
 
     function populateTechnicians() {
-        fetch('/api/technicians')
-            .then(response => response.json())
+        fetchAllPages('/api/technicians', 'technicians')
             .then(technicians => {
-                if (!technicians.Error) {
-                    // Clear the container
-                    technicianFilter.innerHTML = '';
-                    
-                    if (technicians.length === 0) {
-                        technicianFilter.innerHTML = '<div class="text-muted text-center" style="padding: 10px; font-style: italic;">No technicians available</div>';
-                        return;
-                    }
+                // Clear the container
+                technicianFilter.innerHTML = '';
+                
+                if (technicians.length === 0) {
+                    technicianFilter.innerHTML = '<div class="text-muted text-center" style="padding: 10px; font-style: italic;">No technicians available</div>';
+                    return;
+                }
+                
+                // Create technician cards for filtering
+                technicians.forEach(technician => {
+                    const technicianCard = document.createElement('div');
+                    technicianCard.className = 'technician-card filter-card';
+                    technicianCard.textContent = technician.name;
+                    technicianCard.dataset.technicianId = technician.id;
+                    technicianCard.dataset.technicianName = technician.name;
                     
-                    // Create technician cards for filtering
-                    technicians.forEach(technician => {
-                        const technicianCard = document.createElement('div');
-                        technicianCard.className = 'technician-card filter-card';
-                        technicianCard.textContent = technician.name;
-                        technicianCard.dataset.technicianId = technician.id;
-                        technicianCard.dataset.technicianName = technician.name;
-                        
-                        // Add click event listener for filter selection
-                        technicianCard.addEventListener('click', function() {
-                            toggleFilterTechnicianSelection(this);
-                        });
-                        
-                        technicianFilter.appendChild(technicianCard);
+                    // Add click event listener for filter selection
+                    technicianCard.addEventListener('click', function() {
+                        toggleFilterTechnicianSelection(this);
                     });
-                } else {
-                    technicianFilter.innerHTML = '<div class="text-danger text-center" style="padding: 10px;">Error loading technicians</div>';
-                }
+                    
+                    technicianFilter.appendChild(technicianCard);
+                });
             })
             .catch(error => {
                 console.error('Error fetching technicians:', error);
@@ -295,7 +247,7 @@ document.addEventListener('DOMContentLoaded', function() {
         updateFilterTechnicianLabel();
         
         // Apply the filter
-        filterComputers();
+        loadComputers();
     }
     
     // Update the filter technician label to show selection count
@@ -313,8 +265,9 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
-    // Load all computers at once
+    // Load the first page of computers and the technician filter
     loadComputers();
+    populateTechnicians();
 
     // Modal functionality
     const addComputerBtn = document.getElementById('add-computer-btn');
@@ -326,23 +279,17 @@ document.addEventListener('DOMContentLoaded', function() {
     // Function to populate dropdowns
     function populateDropdowns() {
         // Populate profiles dropdown
-        fetch('/api/profiles')
-            .then(response => response.json())
+        fetchAllPages('/api/profiles', 'profiles')
             .then(profiles => {
                 const profileSelect = document.getElementById('profileId');
                 profileSelect.innerHTML = '<option value="">Select a profile...</option>';
                 
-                if (profiles.Error) {
-                    console.error('Error fetching profiles:', profiles.Error);
-                    profileSelect.innerHTML += '<option value="" disabled>Error loading profiles</option>';
-                } else {
-                    profiles.forEach(profile => {
-                        const option = document.createElement('option');
-                        option.value = profile.id;
-                        option.textContent = `${profile.name}${profile.description ? ' - ' + profile.description : ''}`;
-                        profileSelect.appendChild(option);
-                    });
-                }
+                profiles.forEach(profile => {
+                    const option = document.createElement('option');
+                    option.value = profile.id;
+                    option.textContent = `${profile.name}${profile.description ? ' - ' + profile.description : ''}`;
+                    profileSelect.appendChild(option);
+                });
             })
             .catch(error => {
                 console.error('Error fetching profiles:', error);
@@ -351,16 +298,12 @@ document.addEventListener('DOMContentLoaded', function() {
             });
 
         // Populate technicians selection
-        fetch('/api/technicians')
-            .then(response => response.json())
+        fetchAllPages('/api/technicians', 'technicians')
             .then(technicians => {
                 const technicianContainer = document.getElementById('technicianSelection');
                 technicianContainer.innerHTML = '';
                 
-                if (technicians.Error) {
-                    console.error('Error fetching technicians:', technicians.Error);
-                    technicianContainer.innerHTML = '<div class="text-danger text-center" style="padding: 20px;">Error loading technicians</div>';
-                } else if (technicians.length === 0) {
+                if (technicians.length === 0) {
                     technicianContainer.innerHTML = '<div class="text-muted text-center" style="padding: 20px; font-style: italic;">No technicians available</div>';
                 } else {
                     technicians.forEach(technician => {
@@ -133,3 +133,31 @@ document.addEventListener('DOMContentLoaded', function() {
 
 // Make showToast available globally
 window.showToast = showToast;
+
+/**
+ * Fetch every page of a keyset-paginated list endpoint by following next_cursor
+ * @param {string} url - The list endpoint, e.g. '/api/technicians'
+ * @param {string} key - The name of the array holding the items of each page
+ * @returns {Promise<Array>} All items, in order
+ */
+function fetchAllPages(url, key) {
+    const items = [];
+    const separator = url.includes('?') ? '&' : '?';
+
+    function fetchPage(cursor) {
+        const pageUrl = `${url}${separator}limit=200` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : '');
+        return fetch(pageUrl)
+            .then(response => response.json())
+            .then(page => {
+                if (page.Error) {
+                    throw new Error(page.Error);
+                }
+                items.push(...page[key]);
+                return page.next_cursor ? fetchPage(page.next_cursor) : items;
+            });
+    }
+
+    return fetchPage(null);
+}
+
+window.fetchAllPages = fetchAllPages;
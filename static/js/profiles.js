@@ -100,13 +100,8 @@ document.addEventListener('DOMContentLoaded', function() {
         errorContainer.style.display = 'none';
         profilesContent.style.display = 'none';
         
-        fetch('/api/profiles')
-            .then(response => response.json())
+        fetchAllPages('/api/profiles', 'profiles')
             .then(data => {
-                if (data.Error) {
-                    throw new Error(data.Error);
-                }
-                
                 // Store all profiles
                 allProfiles = data;
                 
@@ -223,6 +218,14 @@ document.addEventListener('DOMContentLoaded', function() {
                     });
                     
                     computersContainer.appendChild(computersList);
+                    
+                    // Only the first page is listed, mention the rest by count
+                    if (data.has_more) {
+                        const moreComputersMsg = document.createElement('div');
+                        moreComputersMsg.className = 'text-muted text-center mt-2';
+                        moreComputersMsg.textContent = `...and ${data.computer_count - data.computers.length} more`;
+                        computersContainer.appendChild(moreComputersMsg);
+                    }
                 } else {
                     // No computers using this profile
                     const noComputersMsg = document.createElement('div');
@@ -0,0 +1,18 @@
+import os
+import sys
+
+# Point config_mtrx_module at a private in-memory database before it is imported
+os.environ["CONFIG_MATRIX_DATABASE_URL"] = "sqlite://"
+os.environ["CONFIG_MATRIX_BCRYPT_ROUNDS"] = "4"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from config_mtrx_module.db import Base, engine, init_db, remove_db_session
+
+@pytest.fixture
+def db():
+    """Fresh schema for every test"""
+    init_db()
+    yield engine
+    remove_db_session()
+    Base.metadata.drop_all(engine)
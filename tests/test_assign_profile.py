@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from config_mtrx_module.db import Computers, Profiles, get_db_session
+from config_mtrx_module.computers import assign_profile_to_computers
+
+def seed(count: int) -> None:
+    with get_db_session() as session:
+        old_profile = Profiles(name="Old")
+        session.add_all([old_profile, Profiles(name="New")])
+        session.flush()
+        session.add_all([
+            Computers(name=f"PC-{number}", deadline=datetime(2030, 1, 1), profile=old_profile)
+            for number in range(count)
+        ])
+
+def profile_ids() -> list:
+    with get_db_session() as session:
+        return [computer.profile_id for computer in session.query(Computers).order_by(Computers.id)]
+
+def test_unknown_ids_only_is_not_found(db):
+    seed(1)
+    success, _, results, status_code = assign_profile_to_computers([98, 99], 2)
+
+    assert not success and status_code == 404
+    assert results["reassigned"] == [] and [failure["id"] for failure in results["failed"]] == [98, 99]
+
+def test_failing_chunk_reports_committed_and_failed_ids(db):
+    seed(4)
+    updates = []
+
+    def fail_second_update(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE computers"):
+            updates.append(statement)
+            if len(updates) == 2:
+                raise RuntimeError("disk I/O error")
+
+    event.listen(db, "before_cursor_execute", fail_second_update)
+    try:
+        success, message, results, status_code = assign_profile_to_computers([1, 2, 3, 4, 99], 2, chunk_size=2)
+    finally:
+        event.remove(db, "before_cursor_execute", fail_second_update)
+
+    assert not success and status_code == 207
+    assert results["reassigned"] == [1, 2]
+    assert [failure["id"] for failure in results["failed"]] == [3, 4, 99]
+    assert "1 not found" in message and "2 could not be reassigned" in message
+    # The first chunk stays committed, the failed one was rolled back
+    assert profile_ids() == [2, 2, 1, 1]
+
+def test_partial_success_with_unknown_id_is_multi_status(db):
+    seed(1)
+    success, _, results, status_code = assign_profile_to_computers([1, 99], 2)
+
+    assert not success and status_code == 207
+    assert results["reassigned"] == [1]
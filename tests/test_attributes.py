@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from config_mtrx_module.db import Computers, Profiles, get_db_session
+from config_mtrx_module.profiles import set_profile_attribute
+from config_mtrx_module.computers import get_computer_attributes_by_id
+
+def test_new_null_valued_preset_key_is_propagated(db):
+    with get_db_session() as session:
+        profile = Profiles(name="Laptop")
+        session.add_all([
+            Computers(name="PC-1", deadline=datetime(2030, 1, 1), profile=profile),
+            Computers(name="PC-2", deadline=datetime(2030, 1, 1), profile=profile),
+        ])
+
+    success, message, _ = set_profile_attribute("Laptop", "asset_tag", None, propagate=True)
+
+    assert success and "2 added" in message
+    assert get_computer_attributes_by_id(1)[2] == {"asset_tag": None}
+    assert get_computer_attributes_by_id(2)[2] == {"asset_tag": None}
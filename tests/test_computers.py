@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from config_mtrx_module.db import (
+    Base, Computers, Profiles, SetupSteps, Technicians, ComputerAttributes, get_db_session, init_db
+)
+from config_mtrx_module.computers import retrieve_all_computers, retrieve_computers_page, expand_computer_names
+
+def seed_computers(count: int) -> None:
+    """Create count computers, each with two completed steps, a technician and an attribute"""
+    with get_db_session() as session:
+        steps = [SetupSteps(name="Install OS"), SetupSteps(name="Join domain")]
+        profile = Profiles(name="Laptop", setup_steps_to_follow=steps)
+        technician = Technicians(name="tech", password="x")
+        session.add_all([profile, technician])
+        for number in range(count):
+            session.add(Computers(
+                name=f"PC-{number:04d}",
+                deadline=datetime(2030, 1, 1),
+                profile=profile,
+                technicians=[technician],
+                setup_steps=steps,
+                attributes=[ComputerAttributes(key="os", value="win11")]
+            ))
+
+def count_statements(engine, function):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = function()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, len(statements)
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+def test_retrieve_all_computers_serializes_every_row(db, count):
+    seed_computers(count)
+
+    success, _, computers, status_code = retrieve_all_computers()
+
+    assert success and status_code == 200
+    assert len(computers) == count
+    assert computers[0]["setup_steps"] == [1, 2]
+    assert computers[0]["technicians"] == [{"id": 1, "name": "tech"}]
+    assert computers[0]["attributes"] == {"os": "win11"}
+
+def test_retrieve_all_computers_query_count_is_constant(db):
+    statement_counts = []
+    for count in (1, 10, 100):
+        Base.metadata.drop_all(db)
+        init_db()
+        seed_computers(count)
+
+        (success, _, computers, _), statements = count_statements(db, retrieve_all_computers)
+        assert success and len(computers) == count
+        statement_counts.append(statements)
+
+    # Relations are loaded in bulk, so the number of queries does not grow with the number of computers
+    assert len(set(statement_counts)) == 1, statement_counts
+
+def test_retrieve_computers_page_walks_every_computer_once(db):
+    seed_computers(5)
+
+    names, cursor = [], None
+    while True:
+        success, _, page, status_code = retrieve_computers_page(cursor, 2)
+        assert success and status_code == 200
+        names += [computer["name"] for computer in page["computers"]]
+        assert all(computer["attributes"] == {"os": "win11"} for computer in page["computers"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert names == [f"PC-{number:04d}" for number in range(5)]
+    assert retrieve_computers_page("not-a-cursor")[3] == 400
+
+@pytest.mark.parametrize("pattern", ["PC-{n.foo}", "PC-{n[0]}", "PC-{n:q}", "PC-{n}-{m}", "PC-{n"])
+def test_malformed_name_pattern_is_a_validation_error(pattern):
+    names, error = expand_computer_names(pattern, 3)
+
+    assert names is None and error.startswith(("Invalid pattern", "Pattern must"))
+
+def test_name_pattern_is_expanded(db):
+    assert expand_computer_names("PC-{n:03d}", 2, start=9) == (["PC-009", "PC-010"], None)
@@ -0,0 +1,38 @@
+import pytest
+
+from config_mtrx_module.db import SetupSteps, UnitOfWorkRolledBack, get_db_session
+
+def add_step_swallowing_errors(name: str, fail: bool) -> bool:
+    """A module function that reports its own failure instead of raising"""
+    try:
+        with get_db_session() as session:
+            session.add(SetupSteps(name=name))
+            if fail:
+                raise ValueError("failed after writing")
+        return True
+    except Exception as e:
+        print(e)
+        return False
+
+def step_names() -> list:
+    with get_db_session() as session:
+        return [step.name for step in session.query(SetupSteps).order_by(SetupSteps.id)]
+
+def test_nested_blocks_commit_together(db):
+    with get_db_session():
+        assert add_step_swallowing_errors("First", fail=False)
+        assert add_step_swallowing_errors("Second", fail=False)
+
+    assert step_names() == ["First", "Second"]
+
+def test_swallowed_nested_failure_raises_from_outermost_block(db):
+    with pytest.raises(UnitOfWorkRolledBack):
+        with get_db_session():
+            assert add_step_swallowing_errors("First", fail=False)
+            assert not add_step_swallowing_errors("Second", fail=True)
+
+    assert step_names() == []
+    # The next unit of work starts clean
+    with get_db_session():
+        assert add_step_swallowing_errors("Third", fail=False)
+    assert step_names() == ["Third"]
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from config_mtrx_module.db import Computers, Profiles, SetupSteps, get_db_session
+from config_mtrx_module.computers import search_computers
+from config_mtrx_module.exporter import iter_export_batches
+
+def test_export_progress_matches_cards_for_computer_without_profile(db):
+    with get_db_session() as session:
+        steps = [SetupSteps(name="Install OS"), SetupSteps(name="Join domain")]
+        session.add(Computers(name="PC-1", deadline=datetime(2030, 1, 1),
+                              profile=Profiles(name="Laptop", setup_steps_to_follow=steps), setup_steps=steps[:1]))
+        # Steps marked done before the computer lost its profile
+        session.add(Computers(name="PC-2", deadline=datetime(2030, 1, 1), setup_steps=steps))
+
+    records = [record for batch in iter_export_batches() for record in batch]
+    cards = search_computers()[2]["computers"]
+
+    exported = [(record["completed_steps"], record["remaining_steps"], record["total_steps"]) for record in records]
+    shown = [(card["completed_steps_num"], card["remaining_steps_num"], card["total_step_num"]) for card in cards]
+    assert exported == shown == [(1, 1, 2), (0, 0, 0)]
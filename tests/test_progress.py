@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from config_mtrx_module.db import Computers, Profiles, SetupSteps, get_db_session
+from config_mtrx_module.computers import search_computers, computer_info_by_id
+from config_mtrx_module.exporter import iter_export_batches
+from config_mtrx_module.profiles import remove_step_from_profile
+from config_mtrx_module.progress import get_progress_stats
+
+def test_step_removed_from_profile_after_completion_no_longer_counts(db):
+    with get_db_session() as session:
+        steps = [SetupSteps(name="Install OS"), SetupSteps(name="Join domain"), SetupSteps(name="Encrypt disk")]
+        session.add(Computers(name="PC-1", deadline=datetime(2030, 1, 1),
+                              profile=Profiles(name="Laptop", setup_steps_to_follow=steps), setup_steps=steps[:1]))
+    assert remove_step_from_profile("Laptop", "Install OS")[0]
+
+    expected = {"completed_steps_num": 0, "remaining_steps_num": 2, "total_step_num": 2}
+    card = search_computers()[2]["computers"][0]
+    assert {key: card[key] for key in expected} == expected
+    assert [card["id"] for card in search_computers(state="not_started")[2]["computers"]] == [1]
+
+    info = computer_info_by_id(1)
+    assert {key: info[key] for key in expected} == expected
+    assert info["remaining_steps"] == ["Join domain", "Encrypt disk"]
+
+    record = [record for batch in iter_export_batches() for record in batch][0]
+    assert (record["completed_steps"], record["remaining_steps"], record["total_steps"]) == (0, 2, 2)
+
+    profile_stats = get_progress_stats()[2]["profiles"][0]
+    assert (profile_stats["not_started"], profile_stats["in_progress"]) == (1, 0)
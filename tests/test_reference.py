@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from config_mtrx_module.db import Technicians, SetupSteps, Profiles, Computers, get_db_session
+from config_mtrx_module.versions import bump_data_versions
+from config_mtrx_module.technicians import retrieve_technicians
+from config_mtrx_module.profiles import create_profile, retrieve_profiles
+from config_mtrx_module.steps import create_step, delete_step
+from config_mtrx_module.computers import toggle_step
+from config_mtrx_module.reference import reference_cache
+
+def technician_names() -> list:
+    success, _, page, _ = retrieve_technicians()
+    assert success
+    return [technician["name"] for technician in page["technicians"]]
+
+def test_unchanged_tables_are_served_from_cache(db):
+    with get_db_session() as session:
+        session.add(Technicians(name="tech", password="x"))
+    assert technician_names() == ["tech"]
+
+    hits = reference_cache.stats()["hits"]
+    assert technician_names() == ["tech"]
+    assert reference_cache.stats()["hits"] == hits + 1
+
+def test_change_committed_by_another_process_is_seen(db):
+    with get_db_session() as session:
+        session.add(Technicians(name="tech", password="x"))
+    assert technician_names() == ["tech"]
+
+    # Another worker process writes the row and bumps its counter in the same transaction
+    with db.begin() as connection:
+        connection.execute(update(Technicians.__table__).values(name="renamed"))
+    with get_db_session() as session:
+        bump_data_versions(session, ["technicians"])
+
+    assert technician_names() == ["renamed"]
+
+def test_writes_of_the_current_transaction_are_read_directly(db):
+    assert retrieve_profiles()[2]["profiles"] == []
+
+    with get_db_session():
+        create_profile("Laptop")
+        names = [profile["name"] for profile in retrieve_profiles()[2]["profiles"]]
+    assert names == ["Laptop"]
+
+def test_toggle_resolves_a_recreated_step(db):
+    with get_db_session() as session:
+        session.add(Computers(name="PC-1", deadline=datetime(2030, 1, 1), profile=Profiles(name="Laptop")))
+    create_step("Install OS", "")
+    assert toggle_step("PC-1", "Install OS")[0]
+
+    delete_step("Install OS")
+    create_step("Install OS", "")
+    success, message, _ = toggle_step("PC-1", "Install OS")
+
+    assert success and "complete" in message
+    with get_db_session() as session:
+        step = session.query(SetupSteps).filter_by(name="Install OS").one()
+        assert [completed.id for completed in session.get(Computers, 1).setup_steps] == [step.id]
@@ -0,0 +1,29 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from config_mtrx_module.db import Base, upgrade_schema
+
+def index_names(bind, table: str) -> set:
+    return {index['name'] for index in inspect(bind).get_indexes(table)}
+
+def test_duplicate_names_get_a_non_unique_index_reported_once(capsys):
+    bind = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind)
+    # A database created before computer names were unique
+    with bind.begin() as connection:
+        connection.execute(text("DROP INDEX ix_computers_name"))
+        connection.execute(text("INSERT INTO computers (name) VALUES ('PC-1'), ('PC-1'), ('PC-2')"))
+
+    upgrade_schema(bind)
+    assert "ix_computers_name_nonunique" in index_names(bind, "computers")
+    assert "ix_computers_name" not in index_names(bind, "computers")
+    assert "('PC-1',) x2" in capsys.readouterr().out
+
+    upgrade_schema(bind)
+    assert capsys.readouterr().out == ""
+
+    with bind.begin() as connection:
+        connection.execute(text("DELETE FROM computers WHERE id = 2"))
+    upgrade_schema(bind)
+    assert "ix_computers_name" in index_names(bind, "computers")
+    assert "ix_computers_name_nonunique" not in index_names(bind, "computers")
@@ -0,0 +1,42 @@
+from config_mtrx_module.db import Technicians, get_db_session
+from config_mtrx_module.technicians import technician_cache, load_technician
+
+def add_technician(name: str) -> int:
+    with get_db_session() as session:
+        technician = Technicians(name=name, password="x")
+        session.add(technician)
+        session.flush()
+        return technician.id
+
+def test_rename_drops_technician_cached_before_commit(db):
+    technician_id = add_technician("old")
+    assert load_technician(technician_id) == (technician_id, "old")
+
+    with get_db_session() as session:
+        session.get(Technicians, technician_id).name = "new"
+        session.flush()
+        # Another request reloads the committed row between the flush and the commit
+        technician_cache.set(technician_id, (technician_id, "old"))
+
+    assert load_technician(technician_id) == (technician_id, "new")
+
+def test_bulk_update_drops_technicians_cached_before_commit(db):
+    technician_id = add_technician("old")
+
+    with get_db_session() as session:
+        session.query(Technicians).update({"name": "new"})
+        technician_cache.set(technician_id, (technician_id, "old"))
+
+    assert load_technician(technician_id) == (technician_id, "new")
+
+def test_rollback_drops_technician_cached_during_transaction(db):
+    technician_id = add_technician("old")
+
+    with get_db_session() as session:
+        session.get(Technicians, technician_id).name = "new"
+        session.flush()
+        # Read from inside the transaction, the value is never committed
+        technician_cache.set(technician_id, (technician_id, "new"))
+        session.rollback()
+
+    assert load_technician(technician_id) == (technician_id, "old")
@@ -0,0 +1,38 @@
+from config_mtrx_module.db import Technicians, get_db_session
+from config_mtrx_module.passwords import bcrypt_hash
+from config_mtrx_module.technicians import rehash_technician_password
+from config_mtrx_module.versions import get_data_versions
+
+def technicians_version() -> int:
+    with get_db_session() as session:
+        return get_data_versions(session, ('technicians',))[0]
+
+def add_technician(password_hash: str) -> int:
+    with get_db_session() as session:
+        technician = Technicians(name="tech", password=password_hash)
+        session.add(technician)
+        session.flush()
+        return technician.id
+
+def test_password_rehash_keeps_technicians_version(db):
+    old_hash = bcrypt_hash("Password123@", rounds=4)
+    technician_id = add_technician(old_hash)
+    version = technicians_version()
+
+    rehash_technician_password(technician_id, "Password123@", old_hash)
+
+    with get_db_session() as session:
+        assert session.get(Technicians, technician_id).password != old_hash
+    assert technicians_version() == version
+
+def test_password_only_flush_keeps_technicians_version(db):
+    technician_id = add_technician("x")
+    version = technicians_version()
+
+    with get_db_session() as session:
+        session.get(Technicians, technician_id).password = "y"
+    assert technicians_version() == version
+
+    with get_db_session() as session:
+        session.get(Technicians, technician_id).name = "renamed"
+    assert technicians_version() == version + 1